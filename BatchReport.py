@@ -0,0 +1,270 @@
+# Batch report mode
+# Runs every test case x algorithm of one or more test catalogs headlessly in a
+# process pool, writing a Gantt chart and the results table for each run and
+# one index.html page that links all the outputs.
+
+import argparse
+import os
+import traceback
+from multiprocessing import Pool
+from contextlib import redirect_stdout
+from html import escape
+from io import StringIO
+
+import matplotlib
+import matplotlib.pyplot as plt
+
+import test
+from RR import RoundRobin
+from Lottery import Lottery
+from Stride import Stride
+
+def _init_worker():
+    # Non-interactive backend: figures are only ever written to files
+    matplotlib.use('Agg')
+
+def _run(algorithm, processes, time_quantum):
+    # Same runners as the interactive test menu; plt.show() is a no-op under Agg.
+    # The quantum-based algorithms are called past processData, which would
+    # prompt for the quantum and echo the prompt into the results table.
+    if algorithm == "FCFS":
+        test.run_fcfs(processes)
+    elif algorithm == "SJF":
+        test.run_sjf(processes)
+    elif algorithm == "SJF-NP":
+        test.run_sjf(processes, preemptive=False)
+    elif algorithm == "Priority":
+        test.run_priority(processes)
+    elif algorithm == "Priority-NP":
+        test.run_priority(processes, preemptive=False)
+    elif algorithm == "RR":
+        print(f"\n=== Round Robin Test (Time Quantum = {time_quantum}) ===")
+        # [PID, Arrival, Remaining_Burst, Completed, Original_Burst]
+        proc = [[p[0], p[1], p[2], 0, p[2]] for p in processes]
+        RoundRobin().schedulingProcess(proc, time_quantum)
+    elif algorithm == "EDF":
+        test.run_edf(processes)
+    elif algorithm == "EDF-NP":
+        test.run_edf(processes, preemptive=False)
+    elif algorithm in ("Lottery", "Stride"):
+        print(f"\n=== {algorithm} Test (Time Quantum = {time_quantum}) ===")
+        # [PID, Arrival, Remaining_Burst, Tickets, Completed, Original_Burst]
+        proc = [[p[0], p[1], p[2], p[3], 0, p[2]] for p in processes]
+        scheduler = Lottery() if algorithm == "Lottery" else Stride()
+        scheduler.schedulingProcess(proc, time_quantum)
+
+def _render_job(job):
+    """
+    Run one test case with one algorithm in a worker process
+
+    The printed results table is captured into <base>.txt and the Gantt chart
+    is saved as <base>.<format> for each format. Every figure is closed
+    afterwards, so a long-lived worker does not accumulate figures.
+
+    Returns:
+        str or None: The error traceback if the run failed, otherwise None
+    """
+    algorithm, processes, time_quantum, base, formats, dpi = job
+    output = StringIO()
+    error = None
+    try:
+        with redirect_stdout(output):
+            _run(algorithm, processes, time_quantum)
+        # Figures are closed after every job, so the current one is this run's Gantt chart
+        fig = plt.gcf()
+        for fmt in formats:
+            fig.savefig(f"{base}.{fmt}", dpi=dpi, bbox_inches='tight')
+    except Exception:
+        error = traceback.format_exc()
+        output.write("\n" + error)
+    finally:
+        plt.close('all')
+    with open(f"{base}.txt", "w", encoding="utf-8") as f:
+        f.write(output.getvalue())
+    return error
+
+class BatchReport:
+    """
+    Headless batch rendering of Gantt charts and results tables
+
+    Every test case of every catalog is run with every selected algorithm in a
+    process pool. Workers render with the non-interactive Agg backend and close
+    each figure once it is written, and can be restarted after
+    max_tasks_per_child runs, so hundreds of charts can be generated in
+    parallel with bounded memory. A catalog is a CSV in the test.csv format
+    (test cases introduced by "# Test Case" comments); a plain process CSV
+    without such comments is treated as a single test case.
+
+    Output layout:
+        <output_dir>/index.html
+        <output_dir>/<catalog>/case<k>_<algorithm>.txt   (results table)
+        <output_dir>/<catalog>/case<k>_<algorithm>.png   (Gantt chart, one file per format)
+
+    Usage:
+        BatchReport("report", formats=("png", "svg")).processData(["test.csv"])
+    """
+
+    ALGORITHMS = ("FCFS", "SJF", "SJF-NP", "Priority", "Priority-NP", "RR",
+                  "EDF", "EDF-NP", "Lottery", "Stride")
+    FORMATS = ("png", "svg")
+
+    def __init__(self, output_dir="report", formats=("png",), time_quantum=2, workers=None,
+                 max_tasks_per_child=None, dpi=100):
+        for fmt in formats:
+            if fmt not in self.FORMATS:
+                raise ValueError(f"Unknown format {fmt!r}, expected one of {self.FORMATS}")
+        self.output_dir = output_dir
+        self.formats = tuple(formats)
+        self.time_quantum = time_quantum
+        self.workers = workers
+        self.max_tasks_per_child = max_tasks_per_child
+        self.dpi = dpi
+
+    def loadCatalog(self, filename):
+        """
+        Load the test cases of one catalog
+
+        Args:
+            filename (str): Catalog CSV path
+
+        Returns:
+            list: Test cases as dicts with 'name' and 'processes'
+        """
+        test_cases = test.get_test_cases(filename)
+        if not test_cases:
+            test_cases = [{'name': os.path.basename(filename),
+                           'processes': test.load_processes_from_csv(filename)}]
+        return test_cases
+
+    def buildJobs(self, catalogs, algorithms):
+        """
+        Create the output directories and one job per catalog x test case x algorithm
+
+        Args:
+            catalogs (list): Catalog CSV paths
+            algorithms (list): Algorithm names from BatchReport.ALGORITHMS
+
+        Returns:
+            tuple: (jobs for _render_job, sections for writeIndex as
+                    (catalog filename, directory, test cases))
+        """
+        for algorithm in algorithms:
+            if algorithm not in self.ALGORITHMS:
+                raise ValueError(f"Unknown algorithm {algorithm!r}, expected one of {self.ALGORITHMS}")
+        jobs = []
+        sections = []
+        used = set()
+        for filename in catalogs:
+            directory = os.path.splitext(os.path.basename(filename))[0]
+            while directory in used:
+                directory += "_"
+            used.add(directory)
+            os.makedirs(os.path.join(self.output_dir, directory), exist_ok=True)
+            test_cases = self.loadCatalog(filename)
+            sections.append((filename, directory, test_cases))
+            for k, test_case in enumerate(test_cases, 1):
+                for algorithm in algorithms:
+                    base = os.path.join(self.output_dir, directory, f"case{k}_{algorithm}")
+                    jobs.append((algorithm, test_case['processes'], self.time_quantum,
+                                 base, self.formats, self.dpi))
+        return jobs, sections
+
+    def render(self, jobs):
+        """
+        Run all jobs in a process pool
+
+        Returns:
+            list: Error traceback or None for each job, in job order
+        """
+        workers = self.workers or os.cpu_count() or 1
+        # multiprocessing.Pool rather than ProcessPoolExecutor: its maxtasksperchild
+        # recycles workers (capping what any one can accumulate) on every Python version
+        with Pool(workers, initializer=_init_worker, maxtasksperchild=self.max_tasks_per_child) as pool:
+            return pool.map(_render_job, jobs, chunksize=1)
+
+    def writeIndex(self, sections, algorithms, errors):
+        """
+        Write index.html linking every chart and results table
+
+        Args:
+            sections (list): (catalog filename, directory, test cases) from buildJobs
+            algorithms (list): Algorithm names, one column each
+            errors (list): Result of render, in job order
+
+        Returns:
+            str: Path of the index page
+        """
+        path = os.path.join(self.output_dir, "index.html")
+        errors = iter(errors)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n")
+            f.write("<title>CPU Scheduling Batch Report</title>\n")
+            f.write("<style>\nbody { font-family: sans-serif; margin: 20px; }\n"
+                    "table { border-collapse: collapse; }\n"
+                    "th, td { border: 1px solid #ccc; padding: 4px 8px; text-align: left; }\n"
+                    ".error { color: #d62728; }\n</style>\n")
+            f.write("</head>\n<body>\n<h1>CPU Scheduling Batch Report</h1>\n")
+            f.write(f"<p>Time quantum for RR, Lottery and Stride: {self.time_quantum}</p>\n")
+            for filename, directory, test_cases in sections:
+                f.write(f"<h2>{escape(filename)}</h2>\n<table>\n<tr><th>Test case</th>")
+                for algorithm in algorithms:
+                    f.write(f"<th>{escape(algorithm)}</th>")
+                f.write("</tr>\n")
+                for k, test_case in enumerate(test_cases, 1):
+                    f.write(f"<tr><td>{escape(test_case['name'].lstrip('# '))}</td>")
+                    for algorithm in algorithms:
+                        base = f"{directory}/case{k}_{algorithm}"
+                        if next(errors) is None:
+                            links = [f'<a href="{escape(base)}.{fmt}">{fmt.upper()}</a>' for fmt in self.formats]
+                            links.append(f'<a href="{escape(base)}.txt">table</a>')
+                            f.write(f"<td>{' '.join(links)}</td>")
+                        else:
+                            f.write(f'<td><a class="error" href="{escape(base)}.txt">error</a></td>')
+                    f.write("</tr>\n")
+                f.write("</table>\n")
+            f.write("</body>\n</html>\n")
+        return path
+
+    def processData(self, catalogs, algorithms=ALGORITHMS):
+        """
+        Render every test case x algorithm of the catalogs and write the index page
+
+        Args:
+            catalogs (list): Catalog CSV paths
+            algorithms (list): Algorithm names from BatchReport.ALGORITHMS
+        """
+        jobs, sections = self.buildJobs(catalogs, algorithms)
+        errors = self.render(jobs)
+        path = self.writeIndex(sections, algorithms, errors)
+        failed = sum(1 for error in errors if error is not None)
+        print(f"\nRendered {len(jobs) - failed} of {len(jobs)} runs ({failed} failed)")
+        print(f"Index: {path}")
+        print("\n" + "="*60)
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless batch report of Gantt charts and results tables")
+    parser.add_argument("catalogs", nargs="*", default=["test.csv"],
+                        help="test catalogs in the test.csv format (plain process CSVs are one test case)")
+    parser.add_argument("-o", "--output", default="report", help="output directory")
+    parser.add_argument("-a", "--algorithms", nargs="+", default=list(BatchReport.ALGORITHMS),
+                        help=f"algorithms to run, any of {', '.join(BatchReport.ALGORITHMS)}")
+    parser.add_argument("-f", "--formats", nargs="+", default=["png"],
+                        help=f"chart formats, any of {', '.join(BatchReport.FORMATS)}")
+    parser.add_argument("--quantum", type=int, default=2, help="time quantum for RR, Lottery and Stride")
+    parser.add_argument("--workers", type=int, default=None, help="process pool size")
+    parser.add_argument("--max-tasks-per-child", type=int, default=None,
+                        help="restart each worker after this many runs")
+    parser.add_argument("--dpi", type=int, default=100)
+    args = parser.parse_args()
+    for algorithm in args.algorithms:
+        if algorithm not in BatchReport.ALGORITHMS:
+            parser.error(f"unknown algorithm {algorithm!r}")
+    for fmt in args.formats:
+        if fmt not in BatchReport.FORMATS:
+            parser.error(f"unknown format {fmt!r}")
+    report = BatchReport(args.output, formats=args.formats, time_quantum=args.quantum, workers=args.workers,
+                         max_tasks_per_child=args.max_tasks_per_child, dpi=args.dpi)
+    report.processData(args.catalogs, args.algorithms)
+
+if __name__ == "__main__":
+    main()
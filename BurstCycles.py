@@ -0,0 +1,180 @@
+# CPU/I-O burst cycle simulation
+# Each process alternates CPU bursts and I/O bursts: [CPU, IO, CPU, ..., CPU].
+# Processes waiting on I/O are parked in a heap keyed on I/O completion time
+# and return to the ready queue when their I/O finishes. The simulation is
+# event-driven, so the cost is O(events log n) rather than per-tick scans.
+
+import heapq
+from collections import deque
+from tabulate import tabulate
+
+class BurstCycles:
+    """
+    Event-driven simulator for processes with CPU/I-O burst cycles
+
+    Process data structure: [PID, Arrival, Bursts, Priority]
+    where Bursts is a list of alternating CPU and I/O burst lengths that
+    starts and ends with a CPU burst, e.g. [4, 2, 3] = CPU 4, I/O 2, CPU 3.
+
+    Supported policies (the ready queue discipline for each CPU burst):
+    - "FCFS": FIFO, non-preemptive
+    - "RR": FIFO with a time quantum
+    - "SJF": shortest remaining CPU burst first, preemptive
+    - "Priority": highest priority first, preemptive
+    - "SJF-NP", "Priority-NP": the same orders, non-preemptive (a CPU burst
+      runs to completion once started)
+
+    A preemptive policy switches processes only when a strictly better one
+    becomes ready. Ties are broken by arrival order. The Gantt chart contains
+    (None, start, end) segments for the gaps where the CPU is idle.
+    """
+
+    POLICIES = ("FCFS", "RR", "SJF", "Priority", "SJF-NP", "Priority-NP")
+
+    def simulate(self, process_data, policy, time_slice=None):
+        """
+        Run the simulation and append the results to each process row
+
+        After the run each row is
+        [PID, Arrival, Bursts, Priority, CPU_Time, IO_Time, Completion, Turnaround, Waiting],
+        where Waiting is the time spent in the ready queue.
+
+        Args:
+            process_data (list): Processes as [PID, Arrival, Bursts, Priority]
+            policy (str): One of BurstCycles.POLICIES
+            time_slice (int): Time quantum, required for "RR"
+
+        Returns:
+            list: Gantt segments as (PID, start, end), with PID None when idle
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown policy {policy!r}, expected one of {self.POLICIES}")
+        if policy == "RR" and (time_slice is None or time_slice <= 0):
+            raise ValueError("Round Robin needs a positive time quantum")
+        for proc in process_data:
+            bursts = proc[2]
+            if len(bursts) % 2 == 0:
+                raise ValueError(f"Process {proc[0]}: bursts must start and end with a CPU burst")
+            if any(b <= 0 for b in bursts):
+                raise ValueError(f"Process {proc[0]}: burst lengths must be positive")
+
+        process_data.sort(key=lambda x: x[1])
+        n = len(process_data)
+        use_heap = policy in ("SJF", "Priority", "SJF-NP", "Priority-NP")
+        preemptive = policy in ("SJF", "Priority")
+        phase = [0] * n                                     # Index of the current burst
+        remaining = [proc[2][0] for proc in process_data]   # Remaining time of the current CPU burst
+        ready = [] if use_heap else deque()
+        blocked = []                                        # Heap of (io_end, idx)
+        next_arrival = 0
+        gantt = []
+        s_time = 0
+        completed = 0
+        running = None
+        seg_start = 0
+        slice_end = None
+
+        def key(idx):
+            if policy in ("SJF", "SJF-NP"):
+                return (remaining[idx], idx)
+            return (-process_data[idx][3], idx)
+
+        def make_ready(idx):
+            if use_heap:
+                heapq.heappush(ready, (key(idx), idx))
+            else:
+                ready.append(idx)
+
+        def admit(now):
+            # Merge arrivals and I/O completions in ready-time order (arrivals
+            # first on ties), so FIFO queues stay ordered after a long CPU burst
+            nonlocal next_arrival
+            while True:
+                arrival = process_data[next_arrival][1] if next_arrival < n else float('inf')
+                io_end = blocked[0][0] if blocked else float('inf')
+                if min(arrival, io_end) > now:
+                    break
+                if arrival <= io_end:
+                    make_ready(next_arrival)
+                    next_arrival += 1
+                else:
+                    make_ready(heapq.heappop(blocked)[1])
+
+        def next_event():
+            t = float('inf')
+            if next_arrival < n:
+                t = process_data[next_arrival][1]
+            if blocked and blocked[0][0] < t:
+                t = blocked[0][0]
+            return t
+
+        while completed < n:
+            admit(s_time)
+            if preemptive and running is not None and ready and ready[0][0] < key(running):
+                # A strictly better process became ready: preempt
+                gantt.append((process_data[running][0], seg_start, s_time))
+                make_ready(running)
+                running = None
+            if running is None:
+                if not ready:
+                    t = next_event()
+                    gantt.append((None, s_time, t))
+                    s_time = t
+                    continue
+                running = heapq.heappop(ready)[1] if use_heap else ready.popleft()
+                seg_start = s_time
+                if policy == "RR":
+                    slice_end = s_time + time_slice
+            end = s_time + remaining[running]
+            if policy == "RR":
+                end = min(end, slice_end)
+            elif preemptive:
+                end = min(end, next_event())
+            remaining[running] -= end - s_time
+            s_time = end
+            if remaining[running] == 0:
+                proc = process_data[running]
+                gantt.append((proc[0], seg_start, s_time))
+                if phase[running] + 1 < len(proc[2]):
+                    # Park in the blocked heap until the I/O burst finishes
+                    heapq.heappush(blocked, (s_time + proc[2][phase[running] + 1], running))
+                    phase[running] += 2
+                    remaining[running] = proc[2][phase[running]]
+                else:
+                    proc.append(s_time)
+                    completed += 1
+                running = None
+            elif policy == "RR" and s_time == slice_end:
+                gantt.append((process_data[running][0], seg_start, s_time))
+                # New arrivals join the queue before the preempted process
+                admit(s_time)
+                ready.append(running)
+                running = None
+
+        for proc in process_data:
+            completion = proc.pop()
+            cpu_time = sum(proc[2][0::2])
+            io_time = sum(proc[2][1::2])
+            turnaround = completion - proc[1]
+            proc.extend([cpu_time, io_time, completion, turnaround, turnaround - cpu_time - io_time])
+        return gantt
+
+    def printData(self, process_data, name):
+        """
+        Display the burst-cycle results in a formatted table
+
+        Args:
+            process_data (list): Process rows filled in by simulate
+            name (str): Algorithm name for the heading
+        """
+        process_data.sort(key=lambda x: x[0])
+        headers = ["P ID", "AT", "Bursts", "CPU", "IO", "CT", "TAT", "WT"]
+        data = [[row[0], row[1], " ".join(map(str, row[2]))] + row[4:9] for row in process_data]
+        table = tabulate(data, headers=headers, tablefmt="fancy_grid")
+        avg_tat = sum(row[7] for row in process_data) / len(process_data)
+        avg_wt = sum(row[8] for row in process_data) / len(process_data)
+        print(f"\n{name} Scheduling Results (CPU/I-O Burst Cycles):")
+        print(table)
+        print(f"\nAverage Turnaround Time: {avg_tat:.2f}")
+        print(f"Average Waiting Time:    {avg_wt:.2f}")
+        print("\n" + "="*60)
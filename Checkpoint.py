@@ -0,0 +1,119 @@
+# Checkpointing support for long-running scheduling simulations
+# A scheduler periodically hands its full state to a Checkpoint, which writes
+# it to a compact file. Re-running the scheduler with the same Checkpoint
+# resumes from that file and produces the same final results.
+
+import hashlib
+import os
+import pickle
+import time
+import zlib
+
+class Checkpoint:
+    """
+    Periodic checkpoint writer/reader for the scheduling simulators
+
+    The checkpoint interval can be given in simulated time units (every_time),
+    in wall-clock seconds (every_seconds), or both; a checkpoint is written as
+    soon as either interval has elapsed. The state is pickled and compressed
+    with zlib, and written atomically so an interrupted write never corrupts
+    the previous checkpoint. The file is removed once the simulation finishes.
+
+    Usage:
+        cp = Checkpoint("rr.ckpt", every_time=1000)
+        RoundRobin().schedulingProcess(process_data, 4, checkpoint=cp)
+        # If interrupted, running the same call again resumes from rr.ckpt
+    """
+
+    def __init__(self, filename, every_time=None, every_seconds=None):
+        if every_time is None and every_seconds is None:
+            raise ValueError("Checkpoint needs every_time and/or every_seconds")
+        if every_time is not None and every_time <= 0:
+            raise ValueError("every_time must be positive")
+        if every_seconds is not None and every_seconds <= 0:
+            raise ValueError("every_seconds must be positive")
+        self.filename = filename
+        self.every_time = every_time
+        self.every_seconds = every_seconds
+        self._next_time = None
+        self._last_wall = time.monotonic()
+
+    @staticmethod
+    def fingerprint(process_data):
+        """
+        Return a digest identifying the workload a checkpoint belongs to
+
+        Args:
+            process_data (list): Process rows as given to the scheduler
+
+        Returns:
+            str: Hex digest of the (order-independent) process rows
+        """
+        rows = sorted(tuple(row) for row in process_data)
+        return hashlib.sha1(repr(rows).encode()).hexdigest()
+
+    def due(self, s_time):
+        """
+        Check whether a checkpoint should be written at simulated time s_time
+        """
+        if self.every_time is not None:
+            if self._next_time is None:
+                self._next_time = s_time + self.every_time
+            elif s_time >= self._next_time:
+                return True
+        if self.every_seconds is not None:
+            if time.monotonic() - self._last_wall >= self.every_seconds:
+                return True
+        return False
+
+    def save(self, state):
+        """
+        Write the scheduler state to the checkpoint file
+
+        Args:
+            state (dict): Scheduler state, must contain 's_time'
+        """
+        data = zlib.compress(pickle.dumps(state, pickle.HIGHEST_PROTOCOL))
+        tmp_name = self.filename + ".tmp"
+        with open(tmp_name, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, self.filename)
+        if self.every_time is not None:
+            self._next_time = state['s_time'] + self.every_time
+        self._last_wall = time.monotonic()
+
+    def load(self, algorithm, workload):
+        """
+        Read the saved state, if any
+
+        Args:
+            algorithm (str): Name of the scheduler asking for its state
+            workload (str): Fingerprint of the workload being simulated
+
+        Returns:
+            dict or None: Saved state, or None if there is no checkpoint file
+
+        Raises:
+            ValueError: If the checkpoint belongs to another algorithm or workload
+        """
+        if not os.path.exists(self.filename):
+            return None
+        with open(self.filename, "rb") as f:
+            state = pickle.loads(zlib.decompress(f.read()))
+        if state.get('algorithm') != algorithm:
+            raise ValueError(f"Checkpoint {self.filename} was written by {state.get('algorithm')}, not {algorithm}")
+        if state.get('workload') != workload:
+            raise ValueError(f"Checkpoint {self.filename} was written for a different workload")
+        return state
+
+    def clear(self):
+        """
+        Remove the checkpoint file once the simulation has finished
+
+        The intervals restart too, so the same Checkpoint can be reused for
+        another simulation.
+        """
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
+        self._next_time = None
+        self._last_wall = time.monotonic()
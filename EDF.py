@@ -0,0 +1,223 @@
+# EDF (Earliest Deadline First) Real-Time CPU Scheduling Algorithm
+# This algorithm executes the ready process with the earliest absolute deadline
+# It can be preemptive or non-preemptive; EDF(preemptive=False) selects the latter
+# Deadline misses, lateness statistics and CPU utilization are reported
+
+import heapq
+from tabulate import tabulate
+import matplotlib.pyplot as plt
+import matplotlib.colors as mcolors
+
+class EDF:
+    """
+    Earliest Deadline First (EDF) CPU Scheduling Algorithm Implementation
+
+    EDF is a dynamic-priority real-time scheduling algorithm: the ready process
+    with the earliest absolute deadline gets the CPU. In preemptive mode a running
+    process is interrupted when a process with an earlier deadline arrives.
+
+    The simulation is event-driven: the ready queue is a heap keyed on absolute
+    deadline and the clock jumps from event to event (arrivals and completions),
+    so the cost is O(n log n) regardless of burst sizes.
+
+    Process data structure: [PID, Arrival, Burst, Deadline]
+    Deadline is an absolute time; None means the process has no deadline and
+    is scheduled after every process that has one.
+
+    Advantages:
+    - Optimal for preemptive scheduling of independent jobs on one CPU:
+      if any schedule meets all deadlines, EDF does
+    - Directly expresses real-time requirements
+
+    Disadvantages:
+    - Under overload, deadline misses can cascade (domino effect)
+    - Requires deadline knowledge for every job
+    """
+
+    def __init__(self, preemptive=True):
+        self.preemptive = preemptive
+
+    def processData(self, process_data):
+        """
+        Process the scheduling data for EDF algorithm
+
+        Args:
+            process_data (list): List of processes with [PID, Arrival, Burst, Deadline] format
+        """
+        gantt, sequence_of_process = self.simulate(process_data)
+        t_time = self.calculateTurnaroundTime(process_data)
+        w_time = self.calculateWaitingTime(process_data)
+        stats = self.calculateDeadlineStats(process_data, gantt)
+        self.printData(process_data, t_time, w_time, stats, sequence_of_process)
+        self.plot_gantt(gantt)
+
+    def simulate(self, process_data):
+        """
+        Run the EDF simulation
+
+        Each process row becomes [PID, Arrival, Burst, Deadline, Completion].
+
+        Args:
+            process_data (list): Processes as [PID, Arrival, Burst, Deadline]
+
+        Returns:
+            tuple: (Gantt segments as (PID, start, end), sequence of executed PIDs)
+        """
+        process_data.sort(key=lambda x: x[1])
+        n = len(process_data)
+        remaining = [proc[2] for proc in process_data]
+        keys = [(proc[3] if proc[3] is not None else float('inf'), idx)
+                for idx, proc in enumerate(process_data)]
+        ready_heap = []
+        next_arrival = 0
+        s_time = 0
+        completed = 0
+        running = None
+        seg_start = 0
+        sequence_of_process = []
+        gantt = []
+        while completed < n:
+            while next_arrival < n and process_data[next_arrival][1] <= s_time:
+                heapq.heappush(ready_heap, keys[next_arrival])
+                next_arrival += 1
+            if self.preemptive and running is not None and ready_heap and ready_heap[0] < keys[running]:
+                # A process with an earlier deadline arrived: preempt
+                gantt.append((process_data[running][0], seg_start, s_time))
+                heapq.heappush(ready_heap, keys[running])
+                running = None
+            if running is None:
+                if not ready_heap:
+                    # CPU idle: jump straight to the next arrival
+                    s_time = process_data[next_arrival][1]
+                    continue
+                running = heapq.heappop(ready_heap)[1]
+                seg_start = s_time
+                sequence_of_process.append(process_data[running][0])
+            end = s_time + remaining[running]
+            if self.preemptive and next_arrival < n:
+                end = min(end, process_data[next_arrival][1])
+            remaining[running] -= end - s_time
+            s_time = end
+            if remaining[running] == 0:
+                gantt.append((process_data[running][0], seg_start, s_time))
+                process_data[running].append(s_time)
+                completed += 1
+                running = None
+        return gantt, sequence_of_process
+
+    def calculateTurnaroundTime(self, process_data):
+        """
+        Calculate turnaround time for each process and average
+
+        Turnaround Time = Completion Time - Arrival Time
+
+        Args:
+            process_data (list): List of processes with completion times added
+
+        Returns:
+            float: Average turnaround time
+        """
+        total_turnaround_time = 0
+        for proc in process_data:
+            turnaround_time = proc[4] - proc[1]
+            total_turnaround_time += turnaround_time
+            proc.append(turnaround_time)
+        return total_turnaround_time / len(process_data)
+
+    def calculateWaitingTime(self, process_data):
+        """
+        Calculate waiting time for each process and average
+
+        Waiting Time = Turnaround Time - Burst Time
+
+        Args:
+            process_data (list): List of processes with turnaround times added
+
+        Returns:
+            float: Average waiting time
+        """
+        total_waiting_time = 0
+        for proc in process_data:
+            waiting_time = proc[5] - proc[2]
+            total_waiting_time += waiting_time
+            proc.append(waiting_time)
+        return total_waiting_time / len(process_data)
+
+    def calculateDeadlineStats(self, process_data, gantt):
+        """
+        Calculate lateness for each process plus deadline and utilization statistics
+
+        Lateness = Completion Time - Deadline (negative when the process finishes early)
+        Tardiness = max(0, Lateness)
+        Utilization = CPU busy time / (last completion - first arrival)
+
+        Args:
+            process_data (list): List of processes with waiting times added
+            gantt (list): Gantt segments from simulate
+
+        Returns:
+            dict: misses, jobs_with_deadline, max_lateness, avg_lateness, avg_tardiness, utilization
+        """
+        lateness_values = []
+        for proc in process_data:
+            lateness = proc[4] - proc[3] if proc[3] is not None else None
+            proc.append(lateness)
+            if lateness is not None:
+                lateness_values.append(lateness)
+        busy = sum(end - start for _, start, end in gantt)
+        span = max(proc[4] for proc in process_data) - min(proc[1] for proc in process_data)
+        count = len(lateness_values)
+        return {
+            'misses': sum(1 for lateness in lateness_values if lateness > 0),
+            'jobs_with_deadline': count,
+            'max_lateness': max(lateness_values) if count else None,
+            'avg_lateness': sum(lateness_values) / count if count else None,
+            'avg_tardiness': sum(max(0, lateness) for lateness in lateness_values) / count if count else None,
+            'utilization': busy / span if span else 1.0,
+        }
+
+    def printData(self, process_data, average_turnaround_time, average_waiting_time, stats, sequence_of_process):
+        """
+        Display the scheduling results in a formatted table
+
+        Args:
+            process_data (list): Complete process data with all calculated times
+            average_turnaround_time (float): Average turnaround time
+            average_waiting_time (float): Average waiting time
+            stats (dict): Deadline and utilization statistics
+            sequence_of_process (list): Order in which processes were dispatched
+        """
+        process_data.sort(key=lambda x: x[0])
+        headers = ["P ID", "AT", "BT", "Deadline", "CT", "TAT", "WT", "Lateness"]
+        data = [["-" if v is None else v for v in row[:8]] for row in process_data]
+        table = tabulate(data, headers=headers, tablefmt="fancy_grid")
+        mode = "" if self.preemptive else " (Non-Preemptive)"
+        print(f"\nEDF{mode} Scheduling Results:")
+        print(table)
+        print(f'\nGantt Chart Sequence:')
+        print(sequence_of_process)
+        print("")
+        print(f'1) Average Waiting Time: {average_waiting_time:.2f}')
+        print(f'2) Average Turnaround Time: {average_turnaround_time:.2f}')
+        print(f'3) Deadline Misses: {stats["misses"]} of {stats["jobs_with_deadline"]}')
+        print(f'4) CPU Utilization: {stats["utilization"] * 100:.2f}%')
+        if stats['jobs_with_deadline']:
+            print(f'5) Maximum Lateness: {stats["max_lateness"]}')
+            print(f'6) Average Lateness: {stats["avg_lateness"]:.2f}')
+            print(f'7) Average Tardiness: {stats["avg_tardiness"]:.2f}')
+        print("\n" + "="*60)
+
+    def plot_gantt(self, gantt):
+        fig, ax = plt.subplots()
+        colors = list(mcolors.TABLEAU_COLORS.values())
+        # Assign colors to process IDs in the order they first appear
+        pid_to_color = {}
+        for pid, _, _ in gantt:
+            if pid not in pid_to_color:
+                pid_to_color[pid] = colors[len(pid_to_color) % len(colors)]
+        for (pid, start, end) in gantt:
+            ax.barh(0, end-start, left=start, height=0.3, align='center', color=pid_to_color[pid])
+            ax.text((start+end)/2, 0, f'P{pid}', va='center', ha='center', color='white', fontsize=10)
+        ax.set_yticks([])
+        ax.set_xlabel('Time')
+        ax.set_title('EDF Gantt Chart' if self.preemptive else 'Non-Preemptive EDF Gantt Chart')
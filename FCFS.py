@@ -1,5 +1,6 @@
 from tabulate import tabulate
 import matplotlib.pyplot as plt
+from BurstCycles import BurstCycles
 
 class FCFS:
     """
@@ -38,6 +39,13 @@ class FCFS:
         self.printData(process_data, avg_tat, avg_wt)
         self.plot_gantt(gantt)
 
+    def processCycles(self, process_data):
+        # CPU/I-O burst cycles: process_data rows are [PID, Arrival, Bursts, Priority]
+        cycles = BurstCycles()
+        gantt = cycles.simulate(process_data, "FCFS")
+        cycles.printData(process_data, "FCFS")
+        self.plot_gantt(gantt)
+
     def calculateTurnaroundTime(self, process_data):
         total_tat = 0
         for proc in process_data:
@@ -67,6 +75,11 @@ class FCFS:
     def plot_gantt(self, gantt):
         fig, ax = plt.subplots()
         for i, (pid, start, end) in enumerate(gantt):
+            if pid is None:
+                # CPU idle gap (CPU/I-O burst cycles)
+                ax.barh(0, end-start, left=start, height=0.3, align='center', color='lightgrey', hatch='//')
+                ax.text((start+end)/2, 0, 'Idle', va='center', ha='center', color='black', fontsize=10)
+                continue
             ax.barh(0, end-start, left=start, height=0.3, align='center', label=f'P{pid}' if i==0 else "")
             ax.text((start+end)/2, 0, f'P{pid}', va='center', ha='center', color='white', fontsize=10)
         ax.set_yticks([])
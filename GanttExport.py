@@ -0,0 +1,188 @@
+# Matplotlib-free Gantt chart export
+# Writes a Gantt segment list straight to SVG, or to a self-contained HTML page
+# with pan and zoom, one segment at a time so very long timelines stay cheap.
+
+from html import escape
+
+# Same palette as matplotlib.colors.TABLEAU_COLORS used by plot_gantt
+TABLEAU_COLORS = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd',
+                  '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf']
+
+BAR_Y = 20
+BAR_HEIGHT = 30
+AXIS_Y = BAR_Y + BAR_HEIGHT + 15
+SVG_HEIGHT = AXIS_Y + 10
+MIN_LABEL_WIDTH = 24  # Pixels a segment needs before it gets a P<id> label
+
+class GanttExport:
+    """
+    Streaming SVG/HTML exporter for Gantt segment lists
+
+    Accepts the same (PID, start, end) segments the schedulers pass to
+    plot_gantt. Adjacent segments of the same process are merged, and each
+    PID keeps one color for the whole chart (assigned in order of first
+    appearance, like plot_gantt). Segments with PID None are drawn as grey
+    CPU idle gaps. The output is written segment by segment,
+    so exporting 10^6 segments needs no figure and little memory.
+
+    Usage:
+        gantt = RoundRobin().simulate(process_data, 4)
+        GanttExport().exportSVG(gantt, "rr.svg", "Round Robin Gantt Chart")
+        GanttExport().exportHTML(gantt, "rr.html", "Round Robin Gantt Chart")
+    """
+
+    def __init__(self, max_width=1600, px_per_unit=20):
+        self.max_width = max_width
+        self.px_per_unit = px_per_unit
+
+    def mergeSegments(self, gantt):
+        """
+        Yield segments with adjacent runs of the same PID merged
+
+        Args:
+            gantt (iterable): Segments as (PID, start, end) in time order
+
+        Yields:
+            tuple: Merged (PID, start, end) segments
+        """
+        current = None
+        for pid, start, end in gantt:
+            if current is not None and current[0] == pid and current[2] == start:
+                current = (pid, current[1], end)
+                continue
+            if current is not None:
+                yield current
+            current = (pid, start, end)
+        if current is not None:
+            yield current
+
+    def exportSVG(self, gantt, filename, title="Gantt Chart"):
+        """
+        Write the Gantt chart as a standalone SVG file
+
+        Args:
+            gantt (list): Segments as (PID, start, end) in time order
+            filename (str): Output path
+            title (str): Chart title
+        """
+        with open(filename, "w", buffering=1 << 20) as f:
+            self._writeSVG(f, gantt, title)
+
+    def exportHTML(self, gantt, filename, title="Gantt Chart"):
+        """
+        Write the Gantt chart as a self-contained HTML page with pan and zoom
+
+        Drag to pan, use the mouse wheel to zoom, double-click to reset.
+
+        Args:
+            gantt (list): Segments as (PID, start, end) in time order
+            filename (str): Output path
+            title (str): Chart title
+        """
+        with open(filename, "w", buffering=1 << 20) as f:
+            f.write("<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n")
+            f.write(f"<title>{escape(title)}</title>\n")
+            f.write("<style>\nbody { font-family: sans-serif; margin: 20px; }\n"
+                    "#chart { border: 1px solid #ccc; cursor: grab; user-select: none; overflow: hidden; }\n"
+                    "#chart svg { width: 100%; height: auto; display: block; }\n</style>\n")
+            f.write("</head>\n<body>\n")
+            f.write(f"<h2>{escape(title)}</h2>\n")
+            f.write("<p>Drag to pan, mouse wheel to zoom, double-click to reset.</p>\n")
+            f.write("<div id=\"chart\">\n")
+            self._writeSVG(f, gantt, title, standalone=False)
+            f.write("</div>\n")
+            f.write(_PAN_ZOOM_SCRIPT)
+            f.write("</body>\n</html>\n")
+
+    def _writeSVG(self, f, gantt, title, standalone=True):
+        span = max((end for _, _, end in gantt), default=0) or 1
+        scale = min(self.px_per_unit, self.max_width / span)
+        width = span * scale
+        if standalone:
+            f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:.0f}" height="{SVG_HEIGHT + 20}" '
+                f'viewBox="0 -20 {width:.0f} {SVG_HEIGHT + 20}">\n')
+        f.write(f'<title>{escape(title)}</title>\n<style>\n')
+        for i, color in enumerate(TABLEAU_COLORS):
+            f.write(f'.c{i}{{fill:{color}}}\n')
+        f.write('.idle{fill:#d3d3d3}\n')
+        f.write('text{font:10px sans-serif}\n.l{fill:white;text-anchor:middle;dominant-baseline:central}\n'
+                '.t{text-anchor:middle}\n</style>\n')
+        f.write(f'<text class="t" x="{width / 2:.0f}" y="0" style="font-size:14px">{escape(title)}</text>\n')
+        # Bars are drawn in time units inside a scaled group to keep coordinates short
+        f.write(f'<g transform="scale({scale!r},1)">\n')
+        pid_to_color = {}
+        labels = []
+        for pid, start, end in self.mergeSegments(gantt):
+            if pid is None:
+                css_class = "idle"
+                label = '<tspan style="fill:black">Idle</tspan>'
+            else:
+                color = pid_to_color.get(pid)
+                if color is None:
+                    color = pid_to_color[pid] = len(pid_to_color) % len(TABLEAU_COLORS)
+                css_class = f"c{color}"
+                label = f"P{escape(str(pid))}"
+            f.write(f'<rect class="{css_class}" x="{start}" y="{BAR_Y}" width="{end - start}" height="{BAR_HEIGHT}"/>\n')
+            if (end - start) * scale >= MIN_LABEL_WIDTH:
+                labels.append(f'<text class="l" x="{(start + end) / 2 * scale:.1f}" y="{BAR_Y + BAR_HEIGHT / 2}">{label}</text>\n')
+        f.write('</g>\n')
+        # At most width / MIN_LABEL_WIDTH labels can be collected
+        f.writelines(labels)
+        f.write(f'<line x1="0" y1="{BAR_Y + BAR_HEIGHT}" x2="{width:.0f}" y2="{BAR_Y + BAR_HEIGHT}" stroke="black"/>\n')
+        for tick in self._ticks(span):
+            x = tick * scale
+            f.write(f'<line x1="{x:.1f}" y1="{BAR_Y + BAR_HEIGHT}" x2="{x:.1f}" y2="{BAR_Y + BAR_HEIGHT + 4}" stroke="black"/>'
+                    f'<text class="t" x="{x:.1f}" y="{AXIS_Y}">{tick}</text>\n')
+        f.write(f'<text class="t" x="{width / 2:.0f}" y="{AXIS_Y + 12}">Time</text>\n')
+        f.write('</svg>\n')
+
+    def _ticks(self, span, target=10):
+        # Round tick step to 1, 2 or 5 times a power of ten
+        raw = span / target
+        step = 1
+        while step * 5 < raw:
+            step *= 10
+        for mult in (1, 2, 5, 10):
+            if step * mult >= raw:
+                step *= mult
+                break
+        return range(0, int(span) + 1, max(1, int(step)))
+
+_PAN_ZOOM_SCRIPT = """<script>
+(function () {
+  var svg = document.querySelector('#chart svg');
+  var initial = svg.getAttribute('viewBox').split(' ').map(Number);
+  var box = initial.slice();
+  var drag = null;
+  function apply() { svg.setAttribute('viewBox', box.join(' ')); }
+  function toSvg(e) {
+    var rect = svg.getBoundingClientRect();
+    return [box[0] + (e.clientX - rect.left) / rect.width * box[2],
+            box[1] + (e.clientY - rect.top) / rect.height * box[3]];
+  }
+  svg.addEventListener('wheel', function (e) {
+    e.preventDefault();
+    var factor = e.deltaY < 0 ? 0.8 : 1.25;
+    var p = toSvg(e);
+    box[0] = p[0] - (p[0] - box[0]) * factor;
+    box[1] = p[1] - (p[1] - box[1]) * factor;
+    box[2] *= factor;
+    box[3] *= factor;
+    apply();
+  });
+  svg.addEventListener('mousedown', function (e) {
+    drag = {x: e.clientX, y: e.clientY, box: box.slice()};
+  });
+  window.addEventListener('mouseup', function () { drag = null; });
+  window.addEventListener('mousemove', function (e) {
+    if (!drag) return;
+    var rect = svg.getBoundingClientRect();
+    box[0] = drag.box[0] - (e.clientX - drag.x) / rect.width * box[2];
+    box[1] = drag.box[1] - (e.clientY - drag.y) / rect.height * box[3];
+    apply();
+  });
+  svg.addEventListener('dblclick', function () { box = initial.slice(); apply(); });
+})();
+</script>
+"""
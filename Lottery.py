@@ -0,0 +1,219 @@
+# Lottery CPU Scheduling Algorithm
+# This algorithm holds a lottery every time quantum among the ready processes
+# Each process holds tickets (taken from the Priority column); more tickets
+# means a proportionally larger share of the CPU
+# This implementation is seeded, so runs are reproducible
+
+import random
+from tabulate import tabulate
+import matplotlib.pyplot as plt
+import matplotlib.colors as mcolors
+
+class FenwickTree:
+    """
+    Fenwick (binary indexed) tree over ticket counts
+
+    Supports adding to one count and finding the holder of the k-th ticket,
+    both in O(log n), instead of a linear walk over the ready processes.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.tree = [0] * (size + 1)
+        self.total = 0
+        self.top_bit = 1 << max(0, size.bit_length() - 1)
+
+    def add(self, index, delta):
+        """
+        Add delta to the count at index (0-based)
+        """
+        self.total += delta
+        i = index + 1
+        while i <= self.size:
+            self.tree[i] += delta
+            i += i & -i
+
+    def find(self, ticket):
+        """
+        Return the index holding the given ticket, 0 <= ticket < total
+
+        The holder is the smallest index whose prefix sum exceeds ticket.
+        """
+        pos = 0
+        bit = self.top_bit
+        while bit:
+            nxt = pos + bit
+            if nxt <= self.size and self.tree[nxt] <= ticket:
+                pos = nxt
+                ticket -= self.tree[nxt]
+            bit >>= 1
+        return pos
+
+class Lottery:
+    """
+    Lottery CPU Scheduling Algorithm Implementation
+
+    Lottery scheduling is a proportional-share, preemptive algorithm. Every time
+    quantum a ticket is drawn at random among the tickets of the ready processes,
+    and its holder runs for one quantum (or until it finishes). Over time each
+    process gets CPU time in proportion to its tickets.
+
+    Ticket counts are kept in a Fenwick tree indexed by arrival order, so each
+    draw and each ticket update costs O(log n).
+
+    Process data structure: [PID, Arrival, Remaining_Burst, Tickets, Completed, Original_Burst]
+
+    Advantages:
+    - Proportional sharing controlled by ticket counts
+    - No starvation: every ready process has a chance each quantum
+    - Simple to adjust shares by changing tickets
+
+    Disadvantages:
+    - Shares are only achieved on average; short runs can be unfair
+    - Response time is unpredictable
+    """
+
+    def __init__(self, seed=0):
+        self.seed = seed
+
+    def processData(self, process_data):
+        """
+        Accepts a list of process data: [PID, Arrival, Burst, Priority]
+        The Priority column gives the number of tickets.
+        Prompts for time quantum, then runs the scheduling algorithm.
+        """
+        # Prepare data structure: [PID, Arrival, Remaining_Burst, Tickets, Completed, Original_Burst]
+        for i in range(len(process_data)):
+            pid, arrival, burst, tickets = process_data[i][:4]
+            process_data[i] = [pid, arrival, burst, tickets, 0, burst]
+        time_slice = int(input("Enter Time Quantum (Time Slice): "))
+        print(f"Time Quantum: {time_slice} time units")
+        self.schedulingProcess(process_data, time_slice)
+
+    def schedulingProcess(self, process_data, time_slice):
+        """
+        Executes the Lottery scheduling algorithm and generates a Gantt chart.
+        """
+        gantt = self.simulate(process_data, time_slice)
+        avg_tat = self.calculateTurnaroundTime(process_data)
+        avg_wt = self.calculateWaitingTime(process_data)
+        self.printData(process_data, avg_tat, avg_wt)
+        self.plot_gantt(gantt)
+
+    def simulate(self, process_data, time_slice):
+        """
+        Run the Lottery simulation and return the Gantt segments
+
+        Completion times are appended to the process rows in place.
+
+        Args:
+            process_data (list): Processes as [PID, Arrival, Remaining_Burst, Tickets, Completed, Original_Burst]
+            time_slice (int): Time quantum
+
+        Returns:
+            list: Gantt segments as (PID, start, end)
+        """
+        for proc in process_data:
+            if proc[3] <= 0:
+                raise ValueError(f"Process {proc[0]} needs a positive number of tickets, got {proc[3]}")
+        rng = random.Random(self.seed)
+        process_data.sort(key=lambda x: x[1])
+        n = len(process_data)
+        tickets = FenwickTree(n)
+        next_arrival = 0
+        s_time = 0
+        completed = 0
+        gantt = []
+        while completed < n:
+            while next_arrival < n and process_data[next_arrival][1] <= s_time:
+                tickets.add(next_arrival, process_data[next_arrival][3])
+                next_arrival += 1
+            if tickets.total == 0:
+                # CPU idle: jump straight to the next arrival
+                s_time = process_data[next_arrival][1]
+                continue
+            idx = tickets.find(rng.randrange(tickets.total))
+            proc = process_data[idx]
+            exec_time = min(proc[2], time_slice)
+            start_time = s_time
+            s_time += exec_time
+            proc[2] -= exec_time
+            gantt.append((proc[0], start_time, s_time))
+            if proc[2] == 0:
+                proc[4] = 1
+                proc.append(s_time)  # Completion time
+                tickets.add(idx, -proc[3])
+                completed += 1
+        return gantt
+
+    def calculateTurnaroundTime(self, process_data):
+        """
+        Calculate turnaround time for each process and average
+
+        Turnaround Time = Completion Time - Arrival Time
+
+        Args:
+            process_data (list): List of processes with completion times added
+
+        Returns:
+            float: Average turnaround time
+        """
+        total_tat = 0
+        for proc in process_data:
+            tat = proc[6] - proc[1]
+            proc.append(tat)
+            total_tat += tat
+        return total_tat / len(process_data)
+
+    def calculateWaitingTime(self, process_data):
+        """
+        Calculate waiting time for each process and average
+
+        Waiting Time = Turnaround Time - Original Burst Time
+
+        Args:
+            process_data (list): List of processes with turnaround times added
+
+        Returns:
+            float: Average waiting time
+        """
+        total_wt = 0
+        for proc in process_data:
+            wt = proc[7] - proc[5]
+            proc.append(wt)
+            total_wt += wt
+        return total_wt / len(process_data)
+
+    def printData(self, process_data, avg_tat, avg_wt):
+        """
+        Display the scheduling results in a formatted table
+
+        Args:
+            process_data (list): Complete process data with all calculated times
+            avg_tat (float): Average turnaround time
+            avg_wt (float): Average waiting time
+        """
+        process_data.sort(key=lambda x: x[0])
+        headers = ["P ID", "AT", "Rem_BT", "Tickets", "Completed", "BT", "CT", "TAT", "WT"]
+        data = [row[:9] for row in process_data]
+        table = tabulate(data, headers=headers, tablefmt="fancy_grid")
+        print(f"\nLottery Scheduling Results (seed={self.seed}):")
+        print(table)
+        print(f"\nAverage Turnaround Time: {avg_tat:.2f}")
+        print(f"Average Waiting Time:    {avg_wt:.2f}")
+        print("\n" + "="*60)
+
+    def plot_gantt(self, gantt):
+        fig, ax = plt.subplots()
+        colors = list(mcolors.TABLEAU_COLORS.values())
+        # Assign colors to process IDs in the order they first appear
+        pid_to_color = {}
+        for pid, _, _ in gantt:
+            if pid not in pid_to_color:
+                pid_to_color[pid] = colors[len(pid_to_color) % len(colors)]
+        for (pid, start, end) in gantt:
+            ax.barh(0, end-start, left=start, height=0.3, align='center', color=pid_to_color[pid])
+            ax.text((start+end)/2, 0, f'P{pid}', va='center', ha='center', color='white', fontsize=10)
+        ax.set_yticks([])
+        ax.set_xlabel('Time')
+        ax.set_title('Lottery Scheduling Gantt Chart')
@@ -1,10 +1,12 @@
 # Priority CPU Scheduling Algorithm
 # This algorithm executes processes based on their priority level
 # Higher priority processes are executed first
-# This implementation is preemptive priority scheduling
+# Both preemptive and non-preemptive (Priority(preemptive=False)) modes are implemented
 
+import heapq
 from tabulate import tabulate
 import matplotlib.pyplot as plt
+from BurstCycles import BurstCycles
 import matplotlib.colors as mcolors
 
 class Priority:
@@ -13,6 +15,7 @@ class Priority:
     
     Priority scheduling is a preemptive scheduling algorithm where processes are
     executed based on their priority level. Higher priority processes are executed first.
+    With preemptive=False each process runs to completion once started.
     
     Process data structure: [PID, Arrival, Burst, Priority]
     
@@ -27,12 +30,16 @@ class Priority:
     - Requires priority assignment mechanism
     """
 
-    def processData(self, process_data):
+    def __init__(self, preemptive=True):
+        self.preemptive = preemptive
+
+    def processData(self, process_data, checkpoint=None):
         """
         Process the scheduling data for Priority algorithm
         
         Args:
             process_data (list): List of processes with [PID, Arrival, Burst, Priority] format
+            checkpoint (Checkpoint): Optional checkpoint writer for long preemptive simulations
         """
         # Prepare data structure: [PID, Arrival, Remaining_Burst, Priority, Completed, Original_Burst]
         for i in range(len(process_data)):
@@ -40,13 +47,54 @@ class Priority:
                 # Add Completed=0 and Original_Burst
                 process_data[i].extend([0, process_data[i][2]])
         
-        start_time = []
-        exit_time = []
-        s_time = 0
-        sequence_of_process = []
-        gantt = []
-        process_data.sort(key=lambda x: x[1])
+        if self.preemptive:
+            gantt, sequence_of_process = self.simulate(process_data, checkpoint)
+        else:
+            gantt, sequence_of_process = self.simulateNonPreemptive(process_data)
+        t_time = Priority.calculateTurnaroundTime(self, process_data)
+        w_time = Priority.calculateWaitingTime(self, process_data)
+        Priority.printData(self, process_data, t_time, w_time, sequence_of_process)
+        self.plot_gantt(gantt)
+
+    def simulate(self, process_data, checkpoint=None):
+        """
+        Run the preemptive Priority simulation one time unit at a time
+        
+        Completion times are appended to the process rows in place. If a
+        Checkpoint is given, the state is saved periodically and a run is
+        resumed from the checkpoint file when one exists.
+        
+        Args:
+            process_data (list): Processes as [PID, Arrival, Remaining_Burst, Priority, Completed, Original_Burst]
+            checkpoint (Checkpoint): Optional checkpoint writer
+            
+        Returns:
+            tuple: (Gantt segments as (PID, start, end), sequence of executed PIDs)
+        """
+        state = None
+        if checkpoint is not None:
+            workload = checkpoint.fingerprint(process_data)
+            state = checkpoint.load("Priority", workload)
+        if state is None:
+            s_time = 0
+            sequence_of_process = []
+            gantt = []
+            process_data.sort(key=lambda x: x[1])
+        else:
+            s_time = state['s_time']
+            sequence_of_process = state['sequence_of_process']
+            gantt = state['gantt']
+            process_data[:] = state['process_data']
         while 1:
+            if checkpoint is not None and checkpoint.due(s_time):
+                checkpoint.save({
+                    'algorithm': "Priority",
+                    'workload': workload,
+                    's_time': s_time,
+                    'sequence_of_process': sequence_of_process,
+                    'gantt': gantt,
+                    'process_data': process_data,
+                })
             ready_queue = []
             normal_queue = []
             temp = []
@@ -63,10 +111,8 @@ class Priority:
                 break
             if len(ready_queue) != 0:
                 ready_queue.sort(key=lambda x: x[3], reverse=True)
-                start_time.append(s_time)
                 s_time = s_time + 1
                 e_time = s_time
-                exit_time.append(e_time)
                 sequence_of_process.append(ready_queue[0][0])
                 for k in range(len(process_data)):
                     if process_data[k][0] == ready_queue[0][0]:
@@ -81,10 +127,8 @@ class Priority:
                 normal_queue.sort(key=lambda x: x[1])
                 if s_time < normal_queue[0][1]:
                     s_time = normal_queue[0][1]
-                start_time.append(s_time)
                 s_time = s_time + 1
                 e_time = s_time
-                exit_time.append(e_time)
                 sequence_of_process.append(normal_queue[0][0])
                 for k in range(len(process_data)):
                     if process_data[k][0] == normal_queue[0][0]:
@@ -95,9 +139,61 @@ class Priority:
                 if process_data[k][2] == 0:
                     process_data[k][4] = 1
                     process_data[k].append(e_time)
-        t_time = Priority.calculateTurnaroundTime(self, process_data)
-        w_time = Priority.calculateWaitingTime(self, process_data)
-        Priority.printData(self, process_data, t_time, w_time, sequence_of_process)
+        if checkpoint is not None:
+            checkpoint.clear()
+        return gantt, sequence_of_process
+
+    def simulateNonPreemptive(self, process_data):
+        """
+        Run the non-preemptive Priority simulation
+        
+        Whenever the CPU becomes free, the arrived process with the highest priority
+        is taken from a heap and runs to completion, producing one Gantt segment.
+        An idle CPU jumps straight to the next arrival, so the cost is O(n log n)
+        regardless of burst sizes. Ties are broken by arrival order.
+        
+        Args:
+            process_data (list): Processes as [PID, Arrival, Remaining_Burst, Priority, Completed, Original_Burst]
+            
+        Returns:
+            tuple: (Gantt segments as (PID, start, end), sequence of executed PIDs)
+        """
+        process_data.sort(key=lambda x: x[1])
+        n = len(process_data)
+        s_time = 0
+        ready_heap = []
+        next_arrival = 0
+        sequence_of_process = []
+        gantt = []
+        while next_arrival < n or ready_heap:
+            if not ready_heap and process_data[next_arrival][1] > s_time:
+                s_time = process_data[next_arrival][1]
+            while next_arrival < n and process_data[next_arrival][1] <= s_time:
+                # heapq is a min-heap, so negate the priority
+                heapq.heappush(ready_heap, (-process_data[next_arrival][3], next_arrival))
+                next_arrival += 1
+            _, k = heapq.heappop(ready_heap)
+            start_time = s_time
+            s_time += process_data[k][2]
+            process_data[k][2] = 0
+            process_data[k][4] = 1
+            process_data[k].append(s_time)
+            sequence_of_process.append(process_data[k][0])
+            gantt.append((process_data[k][0], start_time, s_time))
+        return gantt, sequence_of_process
+
+    def processCycles(self, process_data):
+        """
+        Run Priority on processes with CPU/I-O burst cycles
+        
+        Priority(preemptive=False) runs each CPU burst to completion once started.
+        
+        Args:
+            process_data (list): List of processes with [PID, Arrival, Bursts, Priority] format
+        """
+        cycles = BurstCycles()
+        gantt = cycles.simulate(process_data, "Priority" if self.preemptive else "Priority-NP")
+        cycles.printData(process_data, "Priority" if self.preemptive else "Priority (Non-Preemptive)")
         self.plot_gantt(gantt)
 
     def calculateTurnaroundTime(self, process_data):
@@ -134,7 +230,8 @@ class Priority:
         data = [row[:9] for row in process_data]
         
         table = tabulate(data, headers=headers, tablefmt="fancy_grid")
-        print("\nPriority Scheduling Results:")
+        mode = "" if self.preemptive else " (Non-Preemptive)"
+        print(f"\nPriority{mode} Scheduling Results:")
         print(table)
         
         
@@ -150,14 +247,19 @@ class Priority:
     def plot_gantt(self, gantt):
         fig, ax = plt.subplots()
         colors = list(mcolors.TABLEAU_COLORS.values())
-        unique_pids = []
+        # Assign colors to process IDs in the order they first appear
+        pid_to_color = {}
         for pid, _, _ in gantt:
-            if pid not in unique_pids:
-                unique_pids.append(pid)
-        pid_to_color = {pid: colors[i % len(colors)] for i, pid in enumerate(unique_pids)}
+            if pid is not None and pid not in pid_to_color:
+                pid_to_color[pid] = colors[len(pid_to_color) % len(colors)]
         for (pid, start, end) in gantt:
+            if pid is None:
+                # CPU idle gap (CPU/I-O burst cycles)
+                ax.barh(0, end-start, left=start, height=0.3, align='center', color='lightgrey', hatch='//')
+                ax.text((start+end)/2, 0, 'Idle', va='center', ha='center', color='black', fontsize=10)
+                continue
             ax.barh(0, end-start, left=start, height=0.3, align='center', color=pid_to_color[pid])
             ax.text((start+end)/2, 0, f'P{pid}', va='center', ha='center', color='white', fontsize=10)
         ax.set_yticks([])
         ax.set_xlabel('Time')
-        ax.set_title('Priority Scheduling Gantt Chart')
+        ax.set_title('Priority Scheduling Gantt Chart' if self.preemptive else 'Non-Preemptive Priority Scheduling Gantt Chart')
@@ -5,6 +5,7 @@
 
 from tabulate import tabulate
 import matplotlib.pyplot as plt
+from BurstCycles import BurstCycles
 from collections import deque
 import matplotlib.colors as mcolors
 
@@ -31,10 +32,11 @@ class RoundRobin:
     - May not be optimal for all scenarios
     """
 
-    def processData(self, process_data):
+    def processData(self, process_data, checkpoint=None):
         """
         Accepts a list of process data: [PID, Arrival, Burst] or [PID, Arrival, Burst, Priority]
         Prompts for time quantum, then runs the scheduling algorithm.
+        An optional Checkpoint periodically saves the simulation state.
         """
         # Ensure process_data has [PID, Arrival, Remaining_Burst, Completed, Original_Burst]
         # For Round Robin, we only need PID, Arrival, Burst (ignore Priority if present)
@@ -47,27 +49,73 @@ class RoundRobin:
         
         time_slice = int(input("Enter Time Quantum (Time Slice): "))
         print(f"Time Quantum: {time_slice} time units")
-        self.schedulingProcess(process_data, time_slice)
+        self.schedulingProcess(process_data, time_slice, checkpoint)
 
-    def schedulingProcess(self, process_data, time_slice):
+    def schedulingProcess(self, process_data, time_slice, checkpoint=None):
         """
         Executes the Round Robin scheduling algorithm using a deque for the ready queue.
         Generates a Gantt chart of process execution.
         """
-        s_time = 0
-        ready_queue = deque()
-        gantt = []
-        process_data.sort(key=lambda x: x[1])
+        gantt = self.simulate(process_data, time_slice, checkpoint)
+        avg_tat = self.calculateTurnaroundTime(process_data)
+        avg_wt = self.calculateWaitingTime(process_data)
+        self.printData(process_data, avg_tat, avg_wt)
+        self.plot_gantt(gantt)
+
+    def simulate(self, process_data, time_slice, checkpoint=None):
+        """
+        Run the Round Robin simulation and return the Gantt segments
+        
+        Completion times are appended to the process rows in place. If a
+        Checkpoint is given, the state is saved periodically and a run is
+        resumed from the checkpoint file when one exists.
+        
+        Args:
+            process_data (list): Processes as [PID, Arrival, Remaining_Burst, Completed, Original_Burst]
+            time_slice (int): Time quantum
+            checkpoint (Checkpoint): Optional checkpoint writer
+            
+        Returns:
+            list: Gantt segments as (PID, start, end)
+        """
+        state = None
+        if checkpoint is not None:
+            workload = f"{checkpoint.fingerprint(process_data)}/q={time_slice}"
+            state = checkpoint.load("RoundRobin", workload)
+        if state is None:
+            s_time = 0
+            ready_queue = deque()
+            gantt = []
+            process_data.sort(key=lambda x: x[1])
+            next_arrival = 0  # Index of the first process not yet in the ready queue
+            completed = 0
+        else:
+            s_time = state['s_time']
+            ready_queue = deque(state['ready_queue'])
+            gantt = state['gantt']
+            process_data[:] = state['process_data']
+            next_arrival = state['next_arrival']
+            completed = state['completed']
         n = len(process_data)
-        completed = 0
-        mark = [0] * n
         while completed < n:
-            for i in range(n):
-                if process_data[i][1] <= s_time and process_data[i][3] == 0 and mark[i] == 0:
-                    ready_queue.append(i)
-                    mark[i] = 1
+            if checkpoint is not None and checkpoint.due(s_time):
+                checkpoint.save({
+                    'algorithm': "RoundRobin",
+                    'workload': workload,
+                    's_time': s_time,
+                    'ready_queue': list(ready_queue),
+                    'gantt': gantt,
+                    'process_data': process_data,
+                    'next_arrival': next_arrival,
+                    'completed': completed,
+                })
+            # process_data is sorted by arrival, so arrivals form a prefix
+            while next_arrival < n and process_data[next_arrival][1] <= s_time:
+                ready_queue.append(next_arrival)
+                next_arrival += 1
             if not ready_queue:
-                s_time += 1
+                # CPU idle: jump straight to the next arrival
+                s_time = process_data[next_arrival][1]
                 continue
             idx = ready_queue.popleft()
             pid, arrival, rem_bt, completed_flag, orig_bt = process_data[idx]
@@ -76,19 +124,33 @@ class RoundRobin:
             s_time += exec_time
             process_data[idx][2] -= exec_time
             gantt.append((pid, start_time, s_time))
-            for i in range(n):
-                if process_data[i][1] <= s_time and process_data[i][3] == 0 and mark[i] == 0:
-                    ready_queue.append(i)
-                    mark[i] = 1
+            while next_arrival < n and process_data[next_arrival][1] <= s_time:
+                ready_queue.append(next_arrival)
+                next_arrival += 1
             if process_data[idx][2] == 0 and process_data[idx][3] == 0:
                 process_data[idx][3] = 1
                 process_data[idx].append(s_time)  # Completion time
                 completed += 1
             elif process_data[idx][2] > 0:
                 ready_queue.append(idx)
-        avg_tat = self.calculateTurnaroundTime(process_data)
-        avg_wt = self.calculateWaitingTime(process_data)
-        self.printData(process_data, avg_tat, avg_wt)
+        if checkpoint is not None:
+            checkpoint.clear()
+        return gantt
+
+    def processCycles(self, process_data):
+        """
+        Run Round Robin on processes with CPU/I-O burst cycles
+        
+        Prompts for time quantum like processData.
+        
+        Args:
+            process_data (list): List of processes with [PID, Arrival, Bursts, Priority] format
+        """
+        time_slice = int(input("Enter Time Quantum (Time Slice): "))
+        print(f"Time Quantum: {time_slice} time units")
+        cycles = BurstCycles()
+        gantt = cycles.simulate(process_data, "RR", time_slice)
+        cycles.printData(process_data, "Round Robin")
         self.plot_gantt(gantt)
 
     def calculateTurnaroundTime(self, process_data):
@@ -152,13 +214,17 @@ class RoundRobin:
     def plot_gantt(self, gantt):
         fig, ax = plt.subplots()
         colors = list(mcolors.TABLEAU_COLORS.values())
-        # Get all unique process IDs in the order they first appear
-        unique_pids = []
+        # Assign colors to process IDs in the order they first appear
+        pid_to_color = {}
         for pid, _, _ in gantt:
-            if pid not in unique_pids:
-                unique_pids.append(pid)
-        pid_to_color = {pid: colors[i % len(colors)] for i, pid in enumerate(unique_pids)}
+            if pid is not None and pid not in pid_to_color:
+                pid_to_color[pid] = colors[len(pid_to_color) % len(colors)]
         for (pid, start, end) in gantt:
+            if pid is None:
+                # CPU idle gap (CPU/I-O burst cycles)
+                ax.barh(0, end-start, left=start, height=0.3, align='center', color='lightgrey', hatch='//')
+                ax.text((start+end)/2, 0, 'Idle', va='center', ha='center', color='black', fontsize=10)
+                continue
             ax.barh(0, end-start, left=start, height=0.3, align='center', color=pid_to_color[pid])
             ax.text((start+end)/2, 0, f'P{pid}', va='center', ha='center', color='white', fontsize=10)
         ax.set_yticks([])
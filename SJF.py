@@ -1,18 +1,21 @@
 # SJF (Shortest Job First) CPU Scheduling Algorithm
 # This algorithm executes the process with the shortest burst time first
 # It can be preemptive (SJF-P) or non-preemptive (SJF-NP)
-# This implementation is preemptive SJF
+# Both are implemented: SJF(preemptive=False) selects SJF-NP
 
+import heapq
 from tabulate import tabulate
 import matplotlib.pyplot as plt
+from BurstCycles import BurstCycles
 
 class SJF:
     """
     Shortest Job First (SJF) CPU Scheduling Algorithm Implementation
     
     SJF is a scheduling algorithm that selects the process with the smallest burst time
-    for execution. This implementation is preemptive, meaning a running process can be
-    interrupted if a process with shorter burst time arrives.
+    for execution. By default this implementation is preemptive, meaning a running process
+    can be interrupted if a process with shorter burst time arrives. With preemptive=False
+    each process runs to completion once started (SJF-NP).
     
     Process data structure: [PID, Arrival, Remaining_Burst, Completed, Original_Burst]
     
@@ -26,12 +29,16 @@ class SJF:
     - Complex implementation
     """
 
-    def processData(self, process_data):
+    def __init__(self, preemptive=True):
+        self.preemptive = preemptive
+
+    def processData(self, process_data, checkpoint=None):
         """
         Process the scheduling data for SJF algorithm
         
         Args:
             process_data (list): List of processes with [PID, Arrival, Burst] format
+            checkpoint (Checkpoint): Optional checkpoint writer for long preemptive simulations
         """
         # Prepare data structure: [PID, Arrival, Remaining_Burst, Completed, Original_Burst]
         for i in range(len(process_data)):
@@ -39,13 +46,54 @@ class SJF:
                 # Add Completed=0 and Original_Burst
                 process_data[i].extend([0, process_data[i][2]])
         
-        start_time = []
-        exit_time = []
-        s_time = 0
-        sequence_of_process = []
-        gantt = []
-        process_data.sort(key=lambda x: x[1])
+        if self.preemptive:
+            gantt, sequence_of_process = self.simulate(process_data, checkpoint)
+        else:
+            gantt, sequence_of_process = self.simulateNonPreemptive(process_data)
+        t_time = SJF.calculateTurnaroundTime(self, process_data)
+        w_time = SJF.calculateWaitingTime(self, process_data)
+        SJF.printData(self, process_data, t_time, w_time, sequence_of_process)
+        self.plot_gantt(gantt)
+
+    def simulate(self, process_data, checkpoint=None):
+        """
+        Run the preemptive SJF simulation one time unit at a time
+        
+        Completion times are appended to the process rows in place. If a
+        Checkpoint is given, the state is saved periodically and a run is
+        resumed from the checkpoint file when one exists.
+        
+        Args:
+            process_data (list): Processes as [PID, Arrival, Remaining_Burst, Completed, Original_Burst]
+            checkpoint (Checkpoint): Optional checkpoint writer
+            
+        Returns:
+            tuple: (Gantt segments as (PID, start, end), sequence of executed PIDs)
+        """
+        state = None
+        if checkpoint is not None:
+            workload = checkpoint.fingerprint(process_data)
+            state = checkpoint.load("SJF", workload)
+        if state is None:
+            s_time = 0
+            sequence_of_process = []
+            gantt = []
+            process_data.sort(key=lambda x: x[1])
+        else:
+            s_time = state['s_time']
+            sequence_of_process = state['sequence_of_process']
+            gantt = state['gantt']
+            process_data[:] = state['process_data']
         while 1:
+            if checkpoint is not None and checkpoint.due(s_time):
+                checkpoint.save({
+                    'algorithm': "SJF",
+                    'workload': workload,
+                    's_time': s_time,
+                    'sequence_of_process': sequence_of_process,
+                    'gantt': gantt,
+                    'process_data': process_data,
+                })
             ready_queue = []
             normal_queue = []
             temp = []
@@ -62,10 +110,8 @@ class SJF:
                 break
             if len(ready_queue) != 0:
                 ready_queue.sort(key=lambda x: x[2])
-                start_time.append(s_time)
                 s_time = s_time + 1
                 e_time = s_time
-                exit_time.append(e_time)
                 sequence_of_process.append(ready_queue[0][0])
                 for k in range(len(process_data)):
                     if process_data[k][0] == ready_queue[0][0]:
@@ -78,10 +124,8 @@ class SJF:
             if len(ready_queue) == 0:
                 if s_time < normal_queue[0][1]:
                     s_time = normal_queue[0][1]
-                start_time.append(s_time)
                 s_time = s_time + 1
                 e_time = s_time
-                exit_time.append(e_time)
                 sequence_of_process.append(normal_queue[0][0])
                 for k in range(len(process_data)):
                     if process_data[k][0] == normal_queue[0][0]:
@@ -91,9 +135,60 @@ class SJF:
                     process_data[k][3] = 1
                     process_data[k].append(e_time)
                     gantt.append((process_data[k][0], e_time - process_data[k][4], e_time))
-        t_time = SJF.calculateTurnaroundTime(self, process_data)
-        w_time = SJF.calculateWaitingTime(self, process_data)
-        SJF.printData(self, process_data, t_time, w_time, sequence_of_process)
+        if checkpoint is not None:
+            checkpoint.clear()
+        return gantt, sequence_of_process
+
+    def simulateNonPreemptive(self, process_data):
+        """
+        Run the non-preemptive SJF simulation (SJF-NP)
+        
+        Whenever the CPU becomes free, the arrived process with the smallest burst
+        is taken from a heap and runs to completion, producing one Gantt segment.
+        An idle CPU jumps straight to the next arrival, so the cost is O(n log n)
+        regardless of burst sizes. Ties are broken by arrival order.
+        
+        Args:
+            process_data (list): Processes as [PID, Arrival, Remaining_Burst, Completed, Original_Burst]
+            
+        Returns:
+            tuple: (Gantt segments as (PID, start, end), sequence of executed PIDs)
+        """
+        process_data.sort(key=lambda x: x[1])
+        n = len(process_data)
+        s_time = 0
+        ready_heap = []
+        next_arrival = 0
+        sequence_of_process = []
+        gantt = []
+        while next_arrival < n or ready_heap:
+            if not ready_heap and process_data[next_arrival][1] > s_time:
+                s_time = process_data[next_arrival][1]
+            while next_arrival < n and process_data[next_arrival][1] <= s_time:
+                heapq.heappush(ready_heap, (process_data[next_arrival][2], next_arrival))
+                next_arrival += 1
+            _, k = heapq.heappop(ready_heap)
+            start_time = s_time
+            s_time += process_data[k][2]
+            process_data[k][2] = 0
+            process_data[k][3] = 1
+            process_data[k].append(s_time)
+            sequence_of_process.append(process_data[k][0])
+            gantt.append((process_data[k][0], start_time, s_time))
+        return gantt, sequence_of_process
+
+    def processCycles(self, process_data):
+        """
+        Run SJF on processes with CPU/I-O burst cycles
+        
+        SJF(preemptive=False) runs each CPU burst to completion once started.
+        
+        Args:
+            process_data (list): List of processes with [PID, Arrival, Bursts, Priority] format
+        """
+        cycles = BurstCycles()
+        gantt = cycles.simulate(process_data, "SJF" if self.preemptive else "SJF-NP")
+        cycles.printData(process_data, "SJF" if self.preemptive else "SJF (Non-Preemptive)")
         self.plot_gantt(gantt)
 
     def calculateTurnaroundTime(self, process_data):
@@ -152,7 +247,8 @@ class SJF:
         headers = ["P ID", "AT", "Rem_BT", "Completed", "BT", "CT", "TT", "WT"]
         data = [row[:8] for row in process_data]
         table = tabulate(data, headers=headers, tablefmt="fancy_grid")
-        print("\nSJF Scheduling Results:")
+        mode = "" if self.preemptive else " (Non-Preemptive)"
+        print(f"\nSJF{mode} Scheduling Results:")
         print(table)
         print(f'\nGantt Chart Sequence:')
         print(sequence_of_process)
@@ -164,8 +260,13 @@ class SJF:
     def plot_gantt(self, gantt):
         fig, ax = plt.subplots()
         for i, (pid, start, end) in enumerate(gantt):
+            if pid is None:
+                # CPU idle gap (CPU/I-O burst cycles)
+                ax.barh(0, end-start, left=start, height=0.3, align='center', color='lightgrey', hatch='//')
+                ax.text((start+end)/2, 0, 'Idle', va='center', ha='center', color='black', fontsize=10)
+                continue
             ax.barh(0, end-start, left=start, height=0.3, align='center', label=f'P{pid}' if i==0 else "")
             ax.text((start+end)/2, 0, f'P{pid}', va='center', ha='center', color='white', fontsize=10)
         ax.set_yticks([])
         ax.set_xlabel('Time')
-        ax.set_title('SJF Gantt Chart')
\ No newline at end of file
+        ax.set_title('SJF Gantt Chart' if self.preemptive else 'SJF (Non-Preemptive) Gantt Chart')
\ No newline at end of file
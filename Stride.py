@@ -0,0 +1,185 @@
+# Stride CPU Scheduling Algorithm
+# This algorithm is the deterministic counterpart of Lottery scheduling
+# Each process holds tickets (taken from the Priority column) and advances its
+# pass value by a stride inversely proportional to its tickets every quantum
+# The ready process with the lowest pass value runs next
+
+import heapq
+from tabulate import tabulate
+import matplotlib.pyplot as plt
+import matplotlib.colors as mcolors
+
+STRIDE1 = 1 << 20  # Large constant divided by tickets to get each stride
+
+class Stride:
+    """
+    Stride CPU Scheduling Algorithm Implementation
+
+    Stride scheduling is a deterministic, preemptive proportional-share
+    algorithm. Each process has a stride = STRIDE1 / tickets and a pass value.
+    Every time quantum the ready process with the lowest pass runs for one
+    quantum (or until it finishes), then its pass advances by its stride.
+
+    The ready processes are kept in a heap keyed on (pass, arrival order), so
+    each dispatch costs O(log n). A newly arrived process starts at the current
+    global pass (the pass of the last dispatched process), so it can neither
+    monopolize the CPU nor fall behind the processes already running.
+
+    Process data structure: [PID, Arrival, Remaining_Burst, Tickets, Completed, Original_Burst]
+
+    Advantages:
+    - Proportional sharing controlled by ticket counts
+    - Deterministic: shares are exact over short time windows
+    - No starvation
+
+    Disadvantages:
+    - Requires ticket assignment for every process
+    - Context switching overhead like Round Robin
+    """
+
+    def processData(self, process_data):
+        """
+        Accepts a list of process data: [PID, Arrival, Burst, Priority]
+        The Priority column gives the number of tickets.
+        Prompts for time quantum, then runs the scheduling algorithm.
+        """
+        # Prepare data structure: [PID, Arrival, Remaining_Burst, Tickets, Completed, Original_Burst]
+        for i in range(len(process_data)):
+            pid, arrival, burst, tickets = process_data[i][:4]
+            process_data[i] = [pid, arrival, burst, tickets, 0, burst]
+        time_slice = int(input("Enter Time Quantum (Time Slice): "))
+        print(f"Time Quantum: {time_slice} time units")
+        self.schedulingProcess(process_data, time_slice)
+
+    def schedulingProcess(self, process_data, time_slice):
+        """
+        Executes the Stride scheduling algorithm and generates a Gantt chart.
+        """
+        gantt = self.simulate(process_data, time_slice)
+        avg_tat = self.calculateTurnaroundTime(process_data)
+        avg_wt = self.calculateWaitingTime(process_data)
+        self.printData(process_data, avg_tat, avg_wt)
+        self.plot_gantt(gantt)
+
+    def simulate(self, process_data, time_slice):
+        """
+        Run the Stride simulation and return the Gantt segments
+
+        Completion times are appended to the process rows in place.
+
+        Args:
+            process_data (list): Processes as [PID, Arrival, Remaining_Burst, Tickets, Completed, Original_Burst]
+            time_slice (int): Time quantum
+
+        Returns:
+            list: Gantt segments as (PID, start, end)
+        """
+        for proc in process_data:
+            if proc[3] <= 0:
+                raise ValueError(f"Process {proc[0]} needs a positive number of tickets, got {proc[3]}")
+        process_data.sort(key=lambda x: x[1])
+        n = len(process_data)
+        ready_heap = []  # (pass, idx)
+        global_pass = 0
+        next_arrival = 0
+        s_time = 0
+        completed = 0
+        gantt = []
+        while completed < n:
+            while next_arrival < n and process_data[next_arrival][1] <= s_time:
+                heapq.heappush(ready_heap, (global_pass, next_arrival))
+                next_arrival += 1
+            if not ready_heap:
+                # CPU idle: jump straight to the next arrival
+                s_time = process_data[next_arrival][1]
+                continue
+            global_pass, idx = heapq.heappop(ready_heap)
+            proc = process_data[idx]
+            exec_time = min(proc[2], time_slice)
+            start_time = s_time
+            s_time += exec_time
+            proc[2] -= exec_time
+            gantt.append((proc[0], start_time, s_time))
+            # New arrivals join at the pass of the process that just ran
+            while next_arrival < n and process_data[next_arrival][1] <= s_time:
+                heapq.heappush(ready_heap, (global_pass, next_arrival))
+                next_arrival += 1
+            if proc[2] == 0:
+                proc[4] = 1
+                proc.append(s_time)  # Completion time
+                completed += 1
+            else:
+                heapq.heappush(ready_heap, (global_pass + STRIDE1 // proc[3], idx))
+        return gantt
+
+    def calculateTurnaroundTime(self, process_data):
+        """
+        Calculate turnaround time for each process and average
+
+        Turnaround Time = Completion Time - Arrival Time
+
+        Args:
+            process_data (list): List of processes with completion times added
+
+        Returns:
+            float: Average turnaround time
+        """
+        total_tat = 0
+        for proc in process_data:
+            tat = proc[6] - proc[1]
+            proc.append(tat)
+            total_tat += tat
+        return total_tat / len(process_data)
+
+    def calculateWaitingTime(self, process_data):
+        """
+        Calculate waiting time for each process and average
+
+        Waiting Time = Turnaround Time - Original Burst Time
+
+        Args:
+            process_data (list): List of processes with turnaround times added
+
+        Returns:
+            float: Average waiting time
+        """
+        total_wt = 0
+        for proc in process_data:
+            wt = proc[7] - proc[5]
+            proc.append(wt)
+            total_wt += wt
+        return total_wt / len(process_data)
+
+    def printData(self, process_data, avg_tat, avg_wt):
+        """
+        Display the scheduling results in a formatted table
+
+        Args:
+            process_data (list): Complete process data with all calculated times
+            avg_tat (float): Average turnaround time
+            avg_wt (float): Average waiting time
+        """
+        process_data.sort(key=lambda x: x[0])
+        headers = ["P ID", "AT", "Rem_BT", "Tickets", "Completed", "BT", "CT", "TAT", "WT"]
+        data = [row[:9] for row in process_data]
+        table = tabulate(data, headers=headers, tablefmt="fancy_grid")
+        print("\nStride Scheduling Results:")
+        print(table)
+        print(f"\nAverage Turnaround Time: {avg_tat:.2f}")
+        print(f"Average Waiting Time:    {avg_wt:.2f}")
+        print("\n" + "="*60)
+
+    def plot_gantt(self, gantt):
+        fig, ax = plt.subplots()
+        colors = list(mcolors.TABLEAU_COLORS.values())
+        # Assign colors to process IDs in the order they first appear
+        pid_to_color = {}
+        for pid, _, _ in gantt:
+            if pid not in pid_to_color:
+                pid_to_color[pid] = colors[len(pid_to_color) % len(colors)]
+        for (pid, start, end) in gantt:
+            ax.barh(0, end-start, left=start, height=0.3, align='center', color=pid_to_color[pid])
+            ax.text((start+end)/2, 0, f'P{pid}', va='center', ha='center', color='white', fontsize=10)
+        ax.set_yticks([])
+        ax.set_xlabel('Time')
+        ax.set_title('Stride Scheduling Gantt Chart')
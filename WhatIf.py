@@ -0,0 +1,470 @@
+# Incremental what-if recomputation
+# After a small edit to a workload (insert, delete or modify one process),
+# rebuild the schedule only from the first point in time the edit can affect,
+# reusing the earlier prefix of the timeline and the metrics.
+
+import bisect
+from array import array
+from FCFS import FCFS
+from SJF import SJF
+from Priority import Priority
+from RR import RoundRobin
+
+class SnapshotLog:
+    """
+    In-memory checkpoint log used to resume a simulation part-way through
+
+    Implements the same fingerprint/due/save/load/clear interface as
+    Checkpoint, so it can be passed as the checkpoint of SJF.simulate,
+    Priority.simulate and RoundRobin.simulate. A snapshot is kept every
+    every_time simulated time units. The Gantt chart, dispatch sequence and
+    process rows of the latest run are shared rather than copied: Gantt and
+    sequence are append-only, so snapshots store only their lengths, and of the
+    rows a snapshot stores only the remaining bursts of arrived, unfinished
+    processes, in compact arrays. Completed rows never change again, and rows
+    of processes that have not arrived yet are rebuilt by the caller.
+    """
+
+    def __init__(self, every_time):
+        if every_time <= 0:
+            raise ValueError("every_time must be positive")
+        self.every_time = every_time
+        self.snapshots = []
+        self.times = []
+        self.gantt = []
+        self.sequence_of_process = []
+        self.process_data = []
+        self._next_time = 0
+        self._resume = None
+
+    def fingerprint(self, process_data):
+        # Snapshots never outlive the workload they were taken from
+        return None
+
+    def due(self, s_time):
+        return s_time >= self._next_time
+
+    def save(self, state):
+        snapshot = dict(state)
+        rows = state['process_data']
+        self.gantt = state['gantt']
+        self.process_data = rows
+        snapshot['gantt'] = len(state['gantt'])
+        if 'sequence_of_process' in state:
+            self.sequence_of_process = state['sequence_of_process']
+            snapshot['sequence_of_process'] = len(state['sequence_of_process'])
+        s_time = state['s_time']
+        if 'ready_queue' in state:
+            # Round Robin: unfinished arrived rows are the ready queue plus the
+            # arrivals at s_time it has not admitted yet
+            snapshot['ready_queue'] = array('q', state['ready_queue'])
+            arrived = state['next_arrival']
+            while arrived < len(rows) and rows[arrived][1] <= s_time:
+                arrived += 1
+            active = snapshot['ready_queue'] + array('q', range(state['next_arrival'], arrived))
+        else:
+            completed_flag = 4 if state['algorithm'] == "Priority" else 3
+            arrived = 0
+            active = array('q')
+            while arrived < len(rows) and rows[arrived][1] <= s_time:
+                if rows[arrived][completed_flag] == 0:
+                    active.append(arrived)
+                arrived += 1
+        snapshot['arrived'] = arrived
+        snapshot['process_data'] = (active, array('q', [rows[idx][2] for idx in active]))
+        self.snapshots.append(snapshot)
+        self.times.append(s_time)
+        self._next_time = s_time + self.every_time
+
+    def load(self, algorithm, workload):
+        # Hand the prepared resume state to the scheduler once
+        state, self._resume = self._resume, None
+        return state
+
+    def clear(self):
+        pass
+
+    def resumeBefore(self, t):
+        """
+        Prepare to resume from the latest snapshot taken strictly before time t
+
+        Later snapshots are discarded. The latest run's Gantt chart and sequence
+        are truncated in place to the snapshot, and so is its row list, after
+        restoring the rows of the unfinished processes; the caller appends the
+        rows of the processes arriving later, none of which had been looked at yet.
+
+        Args:
+            t (int): Earliest arrival time touched by the edit
+
+        Returns:
+            dict or None: Resume state (its process_data must be completed before
+                          the run), or None when the run must start from scratch
+        """
+        k = bisect.bisect_left(self.times, t) - 1
+        del self.snapshots[k + 1:]
+        del self.times[k + 1:]
+        if k < 0:
+            self._next_time = 0
+            self._resume = None
+            return None
+        snapshot = self.snapshots[k]
+        state = dict(snapshot)
+        # Every run since this snapshot resumed from it or a later one, so the
+        # latest run's timeline and completed rows up to it are still valid
+        del self.gantt[snapshot['gantt']:]
+        state['gantt'] = self.gantt
+        if 'sequence_of_process' in snapshot:
+            del self.sequence_of_process[snapshot['sequence_of_process']:]
+            state['sequence_of_process'] = self.sequence_of_process
+        if 'ready_queue' in snapshot:
+            state['ready_queue'] = list(snapshot['ready_queue'])
+        rows = self.process_data
+        del rows[snapshot['arrived']:]
+        # Unfinished rows: the latest run's row cut back to its prepared width,
+        # with the remaining burst of the snapshot and the completed flag cleared
+        width = 6 if snapshot['algorithm'] == "Priority" else 5
+        active, remaining = snapshot['process_data']
+        for idx, rem in zip(active, remaining):
+            row = rows[idx][:width]
+            row[2] = rem
+            row[width - 2] = 0
+            rows[idx] = row
+        state['process_data'] = rows
+        self._next_time = snapshot['s_time'] + self.every_time
+        self._resume = state
+        return state
+
+class SortedBlocks:
+    """
+    Sorted sequence of (key, row) pairs split into blocks of bounded size
+
+    A flat sorted list shifts O(n) entries on every insert and delete. Here an
+    insert or delete shifts only the entries of one block plus the short list
+    of block maxima, O(BLOCK + n / BLOCK) pointer moves, and locating a key
+    is two binary searches. Keys must be unique.
+    """
+
+    BLOCK = 512
+
+    def __init__(self, items=()):
+        items = list(items)
+        self.keys = [[key for key, _ in items[lo:lo + self.BLOCK]]
+                     for lo in range(0, len(items), self.BLOCK)]
+        self.rows = [[row for _, row in items[lo:lo + self.BLOCK]]
+                     for lo in range(0, len(items), self.BLOCK)]
+        self.maxes = [keys[-1] for keys in self.keys]
+        self.size = len(items)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        for rows in self.rows:
+            yield from rows
+
+    def _locate(self, key):
+        # (block, index) of the first entry >= key; block == len(self.keys) at the end
+        b = bisect.bisect_left(self.maxes, key)
+        if b == len(self.maxes):
+            return b, 0
+        return b, bisect.bisect_left(self.keys[b], key)
+
+    def insert(self, key, row):
+        if not self.keys:
+            self.keys, self.rows, self.maxes = [[key]], [[row]], [key]
+            self.size = 1
+            return
+        b = min(bisect.bisect_left(self.maxes, key), len(self.keys) - 1)
+        keys, rows = self.keys[b], self.rows[b]
+        i = bisect.bisect_left(keys, key)
+        keys.insert(i, key)
+        rows.insert(i, row)
+        self.maxes[b] = keys[-1]
+        self.size += 1
+        if len(keys) > 2 * self.BLOCK:
+            half = len(keys) // 2
+            self.keys[b:b + 1] = [keys[:half], keys[half:]]
+            self.rows[b:b + 1] = [rows[:half], rows[half:]]
+            self.maxes[b:b + 1] = [keys[half - 1], keys[-1]]
+
+    def remove(self, key):
+        """
+        Remove the entry with the given key and return its row
+        """
+        b, i = self._locate(key)
+        keys, rows = self.keys[b], self.rows[b]
+        del keys[i]
+        row = rows.pop(i)
+        self.size -= 1
+        if keys:
+            self.maxes[b] = keys[-1]
+        else:
+            del self.keys[b], self.rows[b], self.maxes[b]
+        return row
+
+    def before(self, key):
+        """
+        Return the row of the last entry < key, or None
+        """
+        b, i = self._locate(key)
+        if i > 0:
+            return self.rows[b][i - 1]
+        return self.rows[b - 1][-1] if b > 0 else None
+
+    def iterFrom(self, key):
+        """
+        Yield (key, row) for the entries >= key in order
+        """
+        b, i = self._locate(key)
+        for block in range(b, len(self.keys)):
+            yield from zip(self.keys[block][i:], self.rows[block][i:])
+            i = 0
+
+class IncrementalFCFS:
+    """
+    FCFS schedule that is updated in place after each edit
+
+    Processes are kept sorted by (Arrival, input order), which is the order
+    FCFS.processData runs them in, in a SortedBlocks sequence. An edit only
+    changes completion times from the edited position onwards, and the
+    recomputation stops as soon as a completion time matches the previous
+    one: every later process then starts exactly as before. One edit
+    therefore costs O(log n + BLOCK + n / BLOCK) to locate and reposition the
+    process plus O(affected suffix) to recompute; running totals keep the
+    averages current.
+
+    Usage:
+        fcfs = IncrementalFCFS([[1, 0, 5], [2, 2, 3], [3, 4, 1]])
+        fcfs.modify(2, burst=6)
+        fcfs.printData()
+    """
+
+    def __init__(self, process_data):
+        self.pid_key = {}
+        self.total_tat = 0
+        self.total_wt = 0
+        items = []
+        # seq is the input order, which breaks ties between equal arrivals
+        for seq, proc in sorted(enumerate(process_data), key=lambda x: (x[1][1], x[0])):
+            if proc[0] in self.pid_key:
+                raise ValueError(f"Process {proc[0]} already exists")
+            key = (proc[1], seq)
+            # Row: [PID, Arrival, Burst, Completion]
+            items.append((key, [proc[0], proc[1], proc[2], None]))
+            self.pid_key[proc[0]] = key
+        self.rows = SortedBlocks(items)
+        self.next_seq = len(process_data)
+        if items:
+            self._recompute(items[0][0])
+
+    def _add(self, pid, arrival, burst, seq=None):
+        if pid in self.pid_key:
+            raise ValueError(f"Process {pid} already exists")
+        if seq is None:
+            seq = self.next_seq
+            self.next_seq += 1
+        key = (arrival, seq)
+        self.rows.insert(key, [pid, arrival, burst, None])
+        self.pid_key[pid] = key
+        return key
+
+    def _remove(self, pid):
+        if pid not in self.pid_key:
+            raise KeyError(f"Unknown process {pid}")
+        key = self.pid_key.pop(pid)
+        row = self.rows.remove(key)
+        if row[3] is not None:
+            self.total_tat -= row[3] - row[1]
+            self.total_wt -= row[3] - row[1] - row[2]
+        return key, row
+
+    def _recompute(self, start_key, edited_key=None):
+        # Recompute from the first process with key >= start_key; the early stop
+        # is only allowed past edited_key, where predecessors are unchanged
+        prev = self.rows.before(start_key)
+        s_time = prev[3] if prev is not None else 0
+        for key, row in self.rows.iterFrom(start_key):
+            completion = max(s_time, row[1]) + row[2]
+            if completion == row[3] and (edited_key is None or key > edited_key):
+                break  # Everything from here on is unchanged
+            if row[3] is not None:
+                self.total_tat -= row[3] - row[1]
+                self.total_wt -= row[3] - row[1] - row[2]
+            row[3] = completion
+            self.total_tat += completion - row[1]
+            self.total_wt += completion - row[1] - row[2]
+            s_time = completion
+
+    def insert(self, process):
+        """
+        Add a process given as [PID, Arrival, Burst]
+        """
+        key = self._add(process[0], process[1], process[2])
+        self._recompute(key, key)
+
+    def delete(self, pid):
+        """
+        Remove the process with the given PID
+        """
+        key, _ = self._remove(pid)
+        self._recompute(key)
+
+    def modify(self, pid, arrival=None, burst=None):
+        """
+        Change the arrival and/or burst time of a process
+        """
+        seq = self.pid_key[pid][1] if pid in self.pid_key else None
+        old_key, row = self._remove(pid)
+        new_key = self._add(pid, row[1] if arrival is None else arrival, row[2] if burst is None else burst, seq)
+        # Processes between the old and new positions have a new predecessor
+        self._recompute(min(old_key, new_key), max(old_key, new_key))
+
+    def results(self):
+        """
+        Return the current schedule
+
+        Returns:
+            tuple: (rows as [PID, Arrival, Burst, Completion, Turnaround, Waiting],
+                    Gantt segments, average turnaround time, average waiting time)
+        """
+        rows = [[pid, arrival, burst, ct, ct - arrival, ct - arrival - burst]
+                for pid, arrival, burst, ct in self.rows]
+        gantt = [(pid, ct - burst, ct) for pid, arrival, burst, ct in self.rows]
+        n = len(self.rows)
+        if n == 0:
+            return rows, gantt, 0.0, 0.0
+        return rows, gantt, self.total_tat / n, self.total_wt / n
+
+    def printData(self):
+        rows, gantt, avg_tat, avg_wt = self.results()
+        FCFS().printData(rows, avg_tat, avg_wt)
+
+class IncrementalScheduler:
+    """
+    What-if recomputation for the SJF, Priority and Round Robin simulations
+
+    The simulation keeps snapshots of its state every `interval` simulated
+    time units. After an edit touching arrival time t, the run resumes from the
+    latest snapshot taken before t, with the edit applied to the processes that
+    have not arrived yet, reusing the earlier prefix of the Gantt chart. The
+    result is identical to re-running the edited workload from time zero.
+
+    Process data structure: [PID, Arrival, Burst] or [PID, Arrival, Burst, Priority]
+
+    Usage:
+        rr = IncrementalScheduler("RR", processes, time_slice=2)
+        rr.modify(3, burst=7)
+        rr.printData()
+    """
+
+    ALGORITHMS = ("SJF", "Priority", "RR")
+
+    def __init__(self, algorithm, process_data, time_slice=None, interval=50):
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Unknown algorithm {algorithm!r}, expected one of {self.ALGORITHMS}")
+        if algorithm == "RR" and time_slice is None:
+            raise ValueError("Round Robin needs a time quantum")
+        self.algorithm = algorithm
+        self.time_slice = time_slice
+        self.log = SnapshotLog(interval)
+        # pid -> [PID, Arrival, Burst, Priority] and input order, to rebuild rows
+        self.workload = {}
+        self.order = {}
+        self.next_seq = 0
+        # (Arrival, input order) -> pid, the order of a from-scratch stable sort by arrival
+        self.arrivals = SortedBlocks()
+        for proc in process_data:
+            self._store(proc)
+        self.process_data = [self._row(pid) for pid in self.workload]
+        self._run()
+
+    def _store(self, proc):
+        pid = proc[0]
+        if pid in self.workload:
+            raise ValueError(f"Process {pid} already exists")
+        self.workload[pid] = [pid, proc[1], proc[2], proc[3] if len(proc) > 3 else 0]
+        self.order[pid] = self.next_seq
+        self.next_seq += 1
+        self.arrivals.insert((proc[1], self.order[pid]), pid)
+
+    def _row(self, pid):
+        # Pristine simulation row for a process that has not arrived yet
+        pid, arrival, burst, priority = self.workload[pid]
+        if self.algorithm == "Priority":
+            return [pid, arrival, burst, priority, 0, burst]
+        return [pid, arrival, burst, 0, burst]
+
+    def _run(self):
+        if self.algorithm == "SJF":
+            self.gantt, self.sequence_of_process = SJF().simulate(self.process_data, self.log)
+        elif self.algorithm == "Priority":
+            self.gantt, self.sequence_of_process = Priority().simulate(self.process_data, self.log)
+        else:
+            self.gantt = RoundRobin().simulate(self.process_data, self.time_slice, self.log)
+            self.sequence_of_process = None
+
+    def _rerun(self, t):
+        # Resume from the latest snapshot before time t. Rows of processes that
+        # have not arrived by the snapshot are rebuilt from the current workload,
+        # since the latest run may have started them or predates the edit.
+        state = self.log.resumeBefore(t)
+        if state is None:
+            self.process_data = [self._row(pid) for pid in self.arrivals]
+        else:
+            self.process_data = state['process_data']
+            # Keys after every (s_time, input order), i.e. arrivals after s_time
+            start = (state['s_time'], self.next_seq)
+            self.process_data.extend(self._row(pid) for _, pid in self.arrivals.iterFrom(start))
+        self._run()
+
+    def insert(self, process):
+        """
+        Add a process given as [PID, Arrival, Burst] or [PID, Arrival, Burst, Priority]
+        """
+        self._store(process)
+        self._rerun(process[1])
+
+    def delete(self, pid):
+        """
+        Remove the process with the given PID
+        """
+        old = self.workload.pop(pid)
+        self.arrivals.remove((old[1], self.order.pop(pid)))
+        self._rerun(old[1])
+
+    def modify(self, pid, arrival=None, burst=None, priority=None):
+        """
+        Change the arrival, burst and/or priority of a process
+        """
+        old = self.workload[pid]
+        new = [pid, old[1] if arrival is None else arrival, old[2] if burst is None else burst,
+               old[3] if priority is None else priority]
+        self.workload[pid] = new
+        self.arrivals.remove((old[1], self.order[pid]))
+        self.arrivals.insert((new[1], self.order[pid]), pid)
+        self._rerun(min(old[1], new[1]))
+
+    def results(self):
+        """
+        Return the current schedule
+
+        Returns:
+            tuple: (process rows with Completion, Turnaround and Waiting appended,
+                    Gantt segments, average turnaround time, average waiting time)
+        """
+        if not self.process_data:
+            return [], list(self.gantt), 0.0, 0.0
+        scheduler = {"SJF": SJF, "Priority": Priority, "RR": RoundRobin}[self.algorithm]()
+        rows = [row[:] for row in self.process_data]
+        avg_tat = scheduler.calculateTurnaroundTime(rows)
+        avg_wt = scheduler.calculateWaitingTime(rows)
+        return rows, list(self.gantt), avg_tat, avg_wt
+
+    def printData(self):
+        rows, gantt, avg_tat, avg_wt = self.results()
+        if self.algorithm == "RR":
+            RoundRobin().printData(rows, avg_tat, avg_wt)
+        elif self.algorithm == "SJF":
+            SJF().printData(rows, avg_tat, avg_wt, self.sequence_of_process)
+        else:
+            Priority().printData(rows, avg_tat, avg_wt, self.sequence_of_process)
@@ -3,27 +3,39 @@ from FCFS import FCFS
 from SJF import SJF
 from Priority import Priority
 from RR import RoundRobin
+from EDF import EDF
+from Lottery import Lottery
+from Stride import Stride
 import csv
 import matplotlib.pyplot as plt
 
 # Helper to load processes from CSV
-def load_processes_from_csv(filename, need_priority=False):
+def load_processes_from_csv(filename, need_priority=False, need_bursts=False, need_deadline=False):
     processes = []
     with open(filename, newline='') as csvfile:
         reader = csv.DictReader(csvfile)
         for row in reader:
-            # All values as int, Priority is optional
+            # All values as int, Priority and Deadline are optional
             pid = int(row['PID'])
             arrival = int(row['Arrival'])
             burst = int(row['Burst'])
-            if need_priority:
+            if need_bursts:
+                # Bursts: space-separated CPU/I-O cycle, e.g. "3 2 2"; defaults to the single Burst
+                bursts = [int(b) for b in row['Bursts'].split()] if row.get('Bursts') else [burst]
+                priority = int(row['Priority']) if 'Priority' in row and row['Priority'] != '' else 0
+                processes.append([pid, arrival, bursts, priority])
+            elif need_deadline:
+                # Deadline is an absolute time; a missing value means no deadline
+                deadline = int(row['Deadline']) if row.get('Deadline') else None
+                processes.append([pid, arrival, burst, deadline])
+            elif need_priority:
                 priority = int(row['Priority']) if 'Priority' in row and row['Priority'] != '' else 0
                 processes.append([pid, arrival, burst, priority])
             else:
                 processes.append([pid, arrival, burst])
     return processes
 
-def get_manual_input(need_priority=False):
+def get_manual_input(need_priority=False, need_deadline=False):
     n = int(input("How many processes? "))
     processes = []
     for i in range(n):
@@ -33,6 +45,9 @@ def get_manual_input(need_priority=False):
         if need_priority:
             priority = int(input(f"Enter Priority for Process {pid}: "))
             processes.append([pid, arrival, burst, priority])
+        elif need_deadline:
+            deadline = input(f"Enter Deadline for Process {pid} (blank for none): ").strip()
+            processes.append([pid, arrival, burst, int(deadline) if deadline else None])
         else:
             processes.append([pid, arrival, burst])
     return processes
@@ -47,23 +62,40 @@ def main():
     print("2. PRESS 2 FOR SJF ALGORITHM (Shortest Job First)")
     print("3. PRESS 3 FOR Priority ALGORITHM (Priority-based Scheduling)")
     print("4. PRESS 4 FOR Round-Robin ALGORITHM (Time Quantum Scheduling)")
+    print("5. PRESS 5 FOR Non-Preemptive SJF ALGORITHM")
+    print("6. PRESS 6 FOR Non-Preemptive Priority ALGORITHM")
+    print("7. PRESS 7 FOR EDF ALGORITHM (Earliest Deadline First)")
+    print("8. PRESS 8 FOR Non-Preemptive EDF ALGORITHM")
+    print("9. PRESS 9 FOR Lottery ALGORITHM (tickets from Priority)")
+    print("10. PRESS 10 FOR Stride ALGORITHM (tickets from Priority)")
     print("")
     choice = int(input("ENTER A NUMBER: "))
     print("")
-    if choice not in [1, 2, 3, 4]:
-        print("Invalid choice! Please enter a number between 1 and 4.")
+    if choice not in [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]:
+        print("Invalid choice! Please enter a number between 1 and 10.")
         return
     print("How do you want to provide process data?")
     print("1. Manual input")
     print("2. Load from processes.csv")
-    mode = int(input("Enter 1 or 2: "))
+    if choice <= 6:
+        print("3. Load CPU/I-O burst cycles from processes.csv (Bursts column)")
+    mode = int(input("Enter 1, 2 or 3: " if choice <= 6 else "Enter 1 or 2: "))
+    if mode == 3 and choice <= 6:
+        processes = load_processes_from_csv("processes.csv", need_bursts=True)
+        schedulers = {1: FCFS(), 2: SJF(), 3: Priority(), 4: RoundRobin(),
+                      5: SJF(preemptive=False), 6: Priority(preemptive=False)}
+        schedulers[choice].processCycles(processes)
+        plt.show()
+        return
     if mode == 2:
         filename = "processes.csv"
-        need_priority = (choice == 3)  # Only Priority algorithm needs priority
-        processes = load_processes_from_csv(filename, need_priority=need_priority)
+        need_priority = choice in (3, 6, 9, 10)  # Priority algorithms, and ticket counts for Lottery/Stride
+        need_deadline = choice in (7, 8)  # Only EDF algorithms need deadlines
+        processes = load_processes_from_csv(filename, need_priority=need_priority, need_deadline=need_deadline)
     else:
-        need_priority = (choice == 3)
-        processes = get_manual_input(need_priority=need_priority)
+        need_priority = choice in (3, 6, 9, 10)
+        need_deadline = choice in (7, 8)
+        processes = get_manual_input(need_priority=need_priority, need_deadline=need_deadline)
     if choice == 1:
         fcfs = FCFS()
         fcfs.processData(processes)
@@ -80,6 +112,30 @@ def main():
         rr = RoundRobin()
         rr.processData(processes)
         plt.show()
+    elif choice == 5:
+        sjf = SJF(preemptive=False)
+        sjf.processData(processes)
+        plt.show()
+    elif choice == 6:
+        priority = Priority(preemptive=False)
+        priority.processData(processes)
+        plt.show()
+    elif choice == 7:
+        edf = EDF()
+        edf.processData(processes)
+        plt.show()
+    elif choice == 8:
+        edf = EDF(preemptive=False)
+        edf.processData(processes)
+        plt.show()
+    elif choice == 9:
+        lottery = Lottery()
+        lottery.processData(processes)
+        plt.show()
+    elif choice == 10:
+        stride = Stride()
+        stride.processData(processes)
+        plt.show()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
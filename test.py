@@ -1,7 +1,6 @@
 import csv
 import sys
 import matplotlib
-matplotlib.use('TkAgg')  # Use TkAgg backend for interactive display
 import matplotlib.pyplot as plt
 import warnings
 warnings.filterwarnings("ignore", category=UserWarning, module="matplotlib")
@@ -10,6 +9,9 @@ from FCFS import FCFS
 from SJF import SJF
 from Priority import Priority
 from RR import RoundRobin
+from EDF import EDF
+from Lottery import Lottery
+from Stride import Stride
 import time
 
 def load_processes_from_csv(filename):
@@ -45,7 +47,11 @@ def load_processes_from_csv(filename):
                 arrival = int(row['Arrival'])
                 burst = int(row['Burst'])
                 priority = int(row['Priority']) if 'Priority' in row and row['Priority'] != '' else None
-                if priority is not None:
+                deadline = int(row['Deadline']) if row.get('Deadline') else None
+                if deadline is not None:
+                    # [PID, Arrival, Burst, Priority, Deadline]
+                    processes.append([pid, arrival, burst, priority if priority is not None else 1, deadline])
+                elif priority is not None:
                     processes.append([pid, arrival, burst, priority])
                 else:
                     processes.append([pid, arrival, burst])
@@ -54,14 +60,14 @@ def load_processes_from_csv(filename):
                 continue
     return processes
 
-def get_test_cases():
+def get_test_cases(filename='test.csv'):
     """Extract test cases from CSV file with their descriptions"""
     test_cases = []
     current_test = None
     current_processes = []
     test_case_number = 0
     
-    with open('test.csv', 'r') as file:
+    with open(filename, 'r') as file:
         lines = file.readlines()
         
     for line in lines:
@@ -98,7 +104,17 @@ def get_test_cases():
                     arrival = int(parts[1])
                     burst = int(parts[2])
                     priority = int(parts[3]) if len(parts) > 3 else 1
-                    current_processes.append([pid, arrival, burst, priority])
+                    if len(parts) > 5 and parts[5].strip():
+                        # Optional Bursts column (CPU/I-O cycle, e.g. "3 2 2"):
+                        # [PID, Arrival, Burst, Priority, Deadline, Bursts]
+                        deadline = int(parts[4]) if parts[4].strip() else None
+                        bursts = [int(b) for b in parts[5].split()]
+                        current_processes.append([pid, arrival, burst, priority, deadline, bursts])
+                    elif len(parts) > 4 and parts[4].strip():
+                        # Optional Deadline column: [PID, Arrival, Burst, Priority, Deadline]
+                        current_processes.append([pid, arrival, burst, priority, int(parts[4])])
+                    else:
+                        current_processes.append([pid, arrival, burst, priority])
                 except ValueError:
                     continue
     
@@ -119,22 +135,30 @@ def run_fcfs(processes):
     fcfs.processData(proc)
     plt.show()
 
-def run_sjf(processes):
-    print("\n=== SJF Test ===")
-    sjf = SJF()
+def run_sjf(processes, preemptive=True):
+    print("\n=== SJF Test ===" if preemptive else "\n=== Non-Preemptive SJF Test ===")
+    sjf = SJF(preemptive=preemptive)
     #  [PID, Arrival, Burst] - create a copy
     proc = [p[:3].copy() for p in processes]
     sjf.processData(proc)
     plt.show()
 
-def run_priority(processes):
-    print("\n=== Priority Test ===")
-    priority = Priority()
+def run_priority(processes, preemptive=True):
+    print("\n=== Priority Test ===" if preemptive else "\n=== Non-Preemptive Priority Test ===")
+    priority = Priority(preemptive=preemptive)
     # [PID, Arrival, Burst, Priority] - create a copy
-    proc = [p.copy() for p in processes]
+    proc = [p[:4].copy() for p in processes]
     priority.processData(proc)
     plt.show()
 
+def run_edf(processes, preemptive=True):
+    print("\n=== EDF Test ===" if preemptive else "\n=== Non-Preemptive EDF Test ===")
+    edf = EDF(preemptive=preemptive)
+    # [PID, Arrival, Burst, Deadline] - processes without a Deadline column have no deadline
+    proc = [[p[0], p[1], p[2], p[4] if len(p) > 4 else None] for p in processes]
+    edf.processData(proc)
+    plt.show()
+
 def run_rr(processes, time_quantum=2):
     print(f"\n=== Round Robin Test (Time Quantum = {time_quantum}) ===")
     rr = RoundRobin()
@@ -149,6 +173,39 @@ def run_rr(processes, time_quantum=2):
     finally:
         sys.stdin = old_stdin
 
+def run_cycles(processes, algorithm, time_quantum=2):
+    print(f"\n=== {algorithm} CPU/I-O Burst Cycles Test ===")
+    # [PID, Arrival, Bursts, Priority] - processes without a Bursts column have one CPU burst
+    proc = [[p[0], p[1], list(p[5]) if len(p) > 5 else [p[2]], p[3]] for p in processes]
+    schedulers = {"FCFS": FCFS(), "SJF": SJF(), "Priority": Priority(), "Round Robin": RoundRobin()}
+    # Simulate input for time quantum (only Round Robin reads it)
+    old_stdin = sys.stdin
+    sys.stdin = StringIO(f"{time_quantum}\n")
+    try:
+        schedulers[algorithm].processCycles(proc)
+        plt.show()
+    finally:
+        sys.stdin = old_stdin
+
+def run_proportional(scheduler, name, processes, time_quantum=2):
+    print(f"\n=== {name} Test (Time Quantum = {time_quantum}) ===")
+    # [PID, Arrival, Burst, Tickets] - tickets come from the Priority column
+    proc = [p[:4].copy() for p in processes]
+    # Simulate input for time quantum
+    old_stdin = sys.stdin
+    sys.stdin = StringIO(f"{time_quantum}\n")
+    try:
+        scheduler.processData(proc)
+        plt.show()
+    finally:
+        sys.stdin = old_stdin
+
+def run_lottery(processes, time_quantum=2):
+    run_proportional(Lottery(), "Lottery", processes, time_quantum)
+
+def run_stride(processes, time_quantum=2):
+    run_proportional(Stride(), "Stride", processes, time_quantum)
+
 def display_menu():
     print("\n" + "="*60)
     print("CPU SCHEDULING ALGORITHMS - TEST CASE RUNNER")
@@ -176,9 +233,17 @@ def display_menu():
                 print("2. SJF (Shortest Job First)")
                 print("3. Priority Scheduling")
                 print("4. Round Robin")
-                print("5. Back to test case selection")
+                print("5. SJF Non-Preemptive")
+                print("6. Priority Non-Preemptive")
+                print("7. EDF (Earliest Deadline First)")
+                print("8. EDF Non-Preemptive")
+                print("9. Lottery (tickets from Priority)")
+                print("10. Stride (tickets from Priority)")
+                print("11. FCFS with CPU/I-O Burst Cycles")
+                print("12. Round Robin with CPU/I-O Burst Cycles")
+                print("13. Back to test case selection")
                 
-                algo_choice = int(input("Select algorithm (1-5): "))
+                algo_choice = int(input("Select algorithm (1-13): "))
                 
                 if algo_choice == 1:
                     run_fcfs(selected_test['processes'])
@@ -190,6 +255,25 @@ def display_menu():
                     time_quantum = int(input("Enter time quantum: "))
                     run_rr(selected_test['processes'], time_quantum)
                 elif algo_choice == 5:
+                    run_sjf(selected_test['processes'], preemptive=False)
+                elif algo_choice == 6:
+                    run_priority(selected_test['processes'], preemptive=False)
+                elif algo_choice == 7:
+                    run_edf(selected_test['processes'])
+                elif algo_choice == 8:
+                    run_edf(selected_test['processes'], preemptive=False)
+                elif algo_choice == 9:
+                    time_quantum = int(input("Enter time quantum: "))
+                    run_lottery(selected_test['processes'], time_quantum)
+                elif algo_choice == 10:
+                    time_quantum = int(input("Enter time quantum: "))
+                    run_stride(selected_test['processes'], time_quantum)
+                elif algo_choice == 11:
+                    run_cycles(selected_test['processes'], "FCFS")
+                elif algo_choice == 12:
+                    time_quantum = int(input("Enter time quantum: "))
+                    run_cycles(selected_test['processes'], "Round Robin", time_quantum)
+                elif algo_choice == 13:
                     display_menu()
                     return
                 else:
@@ -214,4 +298,5 @@ def main():
     display_menu()
 
 if __name__ == "__main__":
+    matplotlib.use('TkAgg')  # Use TkAgg backend for interactive display
     main() 
\ No newline at end of file